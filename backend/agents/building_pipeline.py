@@ -3,23 +3,205 @@ Main building pipeline that orchestrates all agent steps.
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import contextlib
+import importlib.util
+import os
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 from datetime import datetime
-import json
-from sqlalchemy import or_, and_
+from collections import defaultdict
+from sqlalchemy import or_, insert, update, select, bindparam
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+from sqlalchemy.dialects import postgresql, sqlite
+import httpx
 import logging
 
 from .get_buildings import BuildingFinder
 from .enrich_building import BuildingEnricher
-from .contact_finder.contact_finder import ContactFinder
-from db.models import Building, ContactSource
-from langchain_openai import OpenAI
-from playwright.async_api import async_playwright
+from .contact_finder.contact_finder import (
+    ContactFinder, PAGE_POOL_SIZE, cache_contacts, get_cached_contacts, get_shared_browser
+)
+from db.models import Building, ContactSource, ContactCache
+from db.bulk_copy import supports_copy, copy_rows
+from db.contact_cache import has_contact, load_cached_contacts
+from langchain_openai import ChatOpenAI
+from langchain_core.globals import set_llm_cache
+from langchain_community.cache import SQLiteCache
+from openai import AsyncOpenAI
 from .utils.bounding_box import BoundingBox
+from .utils.address import canonical_address
+from .utils.retry import LLM_REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+# Number of building rows sent per bulk INSERT while processing bounding boxes
+INSERT_CHUNK_SIZE = 500
+
+# Maximum number of bounding boxes searched concurrently
+BBOX_CONCURRENCY = 8
+
+# Batches at least this large are loaded through PostgreSQL COPY instead of
+# INSERT; the streaming consumer flushes every INSERT_CHUNK_SIZE rows, so only
+# bigger batches handed to _insert_buildings in one go take this path
+COPY_CHUNK_SIZE = 5000
+
+# (column, enriched_data key, default) for building row fields copied from enrichment
+_ENRICHED_FIELDS = (
+    ('name', 'name', None),
+    ('standardized_address', 'standardized_address', None),
+    ('latitude', 'latitude', None),
+    ('longitude', 'longitude', None),
+    ('building_type', 'building_type', 'residential_apartment'),
+    ('website', 'website', None),
+    ('property_manager', 'property_manager', None),
+    ('number_of_units', 'number_of_units', None),
+    ('year_built', 'year_built', None),
+    ('square_footage', 'square_footage', None),
+    ('is_coop', 'is_coop', False),
+    ('is_mixed_use', 'is_mixed_use', False),
+    ('total_apartments', 'total_apartments', None),
+    ('two_bedroom_apartments', 'two_bedroom_apartments', None),
+    ('recent_2br_rent', 'recent_2br_rent', None),
+    ('rent_range_2br', 'rent_range_2br', None),
+    ('has_laundry', 'has_laundry', False),
+    ('laundry_type', 'laundry_type', None),
+    ('amenities', 'amenities', None),
+    ('pet_policy', 'pet_policy', None),
+    ('building_style', 'building_style', None),
+    ('management_company', 'management_company', None),
+    ('recent_availability', 'recent_availability', False),
+    ('rental_notes', 'rental_notes', None),
+    ('neighborhood', 'neighborhood', None),
+    ('stories', 'stories', None),
+)
+
+# (column, contact_info key, default) for building row fields copied from the contact lookup
+_CONTACT_FIELDS = (
+    ('contact_email', 'email', None),
+    ('contact_name', 'name', None),
+    ('contact_phone', 'contact_phone', None),
+    ('contact_source', 'source', None),
+    ('contact_source_url', 'source_url', None),
+    ('contact_email_confidence', 'contact_email_confidence', 0),
+    ('contact_verified', 'contact_verified', False),
+    ('verification_notes', 'verification_notes', None),
+    ('verification_flags', 'verification_flags', None),
+)
+
+# Bulk INSERT statement reused for every chunk of building rows; RETURNING hands
+# back the new Building objects (with ids) from the same round trip
+_BUILDING_INSERT = insert(Building).returning(Building)
+
+# Same statement with ON CONFLICT DO NOTHING for dialects that support it, so a
+# row that collides with a stored building (e.g. one inserted by a concurrent
+# run after the duplicate check) is skipped instead of failing the transaction.
+# No conflict target is given so a collision on any unique key (address,
+# canonical_address, standardized_address, name) is skipped.
+_BUILDING_UPSERTS = {
+    'postgresql': postgresql.insert(Building).on_conflict_do_nothing().returning(Building),
+    'sqlite': sqlite.insert(Building).on_conflict_do_nothing().returning(Building),
+}
+
+# Stored buildings matching any candidate key; built once so every run reuses
+# the same cached statement with expanding IN parameters
+_EXISTING_BUILDINGS = select(
+    Building.address, Building.standardized_address, Building.name, Building.canonical_address
+).where(
+    or_(
+        Building.address.in_(bindparam('addresses', expanding=True)),
+        Building.canonical_address.in_(bindparam('canonical_addresses', expanding=True)),
+        Building.standardized_address.in_(bindparam('standardized_addresses', expanding=True)),
+        Building.name.in_(bindparam('names', expanding=True))
+    )
+)
+
+# Maximum number of buildings enriched concurrently (bounded for OpenAI rate limits;
+# override with PIPELINE_CONCURRENCY)
+ENRICH_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", "5"))
+
+# Maximum number of concurrent contact lookups; one per page in ContactFinder's pool
+CONTACT_CONCURRENCY = PAGE_POOL_SIZE
+
+# Main enrichment model, and the cheaper model tried first for the AI analysis
+# (override with FAST_LLM_MODEL; set it empty to always use the main model)
+LLM_MODEL = "gpt-4-turbo-preview"
+FAST_LLM_MODEL = os.getenv("FAST_LLM_MODEL", "gpt-4o-mini")
+
+# SQLite file backing the LangChain LLM response cache (override with LLM_CACHE_PATH)
+LLM_CACHE_PATH = ".langchain.db"
+
+# Connections in the pool shared by the LangChain LLM clients (override with LLM_MAX_CONNECTIONS)
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "50"))
+
+# Maximum number of finished building rows waiting to be inserted
+ROW_QUEUE_SIZE = 64
+
+# Event loop shared by the synchronous wrappers, run on a daemon thread
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            # uvloop's event loop is noticeably faster for the pipeline's network I/O
+            _LOOP = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="building-pipeline-loop", daemon=True).start()
+        return _LOOP
+
+
+def _run_sync(coro):
+    """Run a coroutine on the shared background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+# LangChain LLM clients, keyed by API key, model and the HTTP client they send through
+_LLMS: Dict[Tuple[Optional[str], str, Optional[httpx.AsyncClient]], ChatOpenAI] = {}
+_LLMS_LOCK = threading.Lock()
+
+
+def new_llm_http_client() -> httpx.AsyncClient:
+    """Create a keep-alive connection pool for LLM requests, using HTTP/2 when the h2 package is installed."""
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_CONNECTIONS
+        )
+    )
+
+
+def get_llm(
+    api_key: Optional[str] = None,
+    model_name: str = LLM_MODEL,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> ChatOpenAI:
+    """Return the shared pipeline LLM for an API key, model and HTTP client, creating it (and the response cache) on first use."""
+    with _LLMS_LOCK:
+        llm = _LLMS.get((api_key, model_name, http_client))
+        if llm is None:
+            if not _LLMS:
+                # Prompts run at temperature 0, so repeated enrichment prompts can be answered from cache
+                set_llm_cache(SQLiteCache(database_path=os.getenv("LLM_CACHE_PATH", LLM_CACHE_PATH)))
+            # Both tiers are chat models, served by the chat completions endpoint
+            llm = ChatOpenAI(
+                api_key=api_key,
+                temperature=0,
+                model_name=model_name,
+                timeout=LLM_REQUEST_TIMEOUT,
+                max_retries=0,
+                http_async_client=http_client
+            )
+            _LLMS[(api_key, model_name, http_client)] = llm
+        return llm
+
+
 class BuildingPipeline:
     """
     Main pipeline that orchestrates the building discovery and outreach process.
@@ -27,41 +209,54 @@ class BuildingPipeline:
     
     def __init__(self, google_api_key: str = None, openai_api_key: str = None):
         """Initialize the pipeline components."""
-        # Initialize OpenAI client
-        self.llm = OpenAI(
-            api_key=openai_api_key,
-            temperature=0,
-            model_name="gpt-4-turbo-preview"
+        # Initialize OpenAI client; both tiers share the pipeline's own
+        # connection pool, closed by aclose()
+        self._llm_http_client = new_llm_http_client()
+        self.llm = get_llm(openai_api_key, http_client=self._llm_http_client)
+        self.llm_fast = (
+            get_llm(openai_api_key, FAST_LLM_MODEL, http_client=self._llm_http_client) if FAST_LLM_MODEL else None
         )
         
+        # One async OpenAI client (and HTTP connection pool) shared by the sub-agents
+        openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        self.openai_client = AsyncOpenAI(api_key=openai_api_key, max_retries=0) if openai_api_key else None
+        
         # Initialize pipeline components
-        self.building_finder = BuildingFinder(google_api_key)
-        self.building_enricher = BuildingEnricher(llm=self.llm)
+        self.building_finder = BuildingFinder(google_api_key, openai_client=self.openai_client)
+        self.building_enricher = BuildingEnricher(llm=self.llm, llm_fast=self.llm_fast)
         
         # Initialize browser for contact finder
         self.browser = None
-        self.context = None
-        self.page = None
         
         # Initialize contact finder
         self.contact_finder = ContactFinder()
         
+        self.enrich_concurrency = ENRICH_CONCURRENCY
+        
+        # Contact lookups are cached in memory by ContactFinder's shared TTL
+        # cache and across runs by the contact_cache table; new entries wait in
+        # _pending_contact_cache until a pipeline transaction writes them
+        # In-flight lookups per event loop (approvals run on the server loop,
+        # bounding box runs on the background loop), then per address as
+        # [task, number of waiting callers]
+        self._contact_inflight: Dict[asyncio.AbstractEventLoop, Dict[str, list]] = {}
+        self._pending_contact_cache: Dict[str, Dict[str, Any]] = {}
+        
     async def _init_browser(self):
         """Initialize browser for contact finder."""
         try:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(headless=True)
-            self.context = await self.browser.new_context()
-            self.page = await self.context.new_page()
+            # Chromium is launched once and reused across pipelines; each pipeline
+            # only opens its own contexts
+            self.browser = await get_shared_browser()
             
-            # Update contact finder with browser instance
+            # Contact finder opens its own context per pooled page from the
+            # shared browser, so concurrent lookups never share page state
             self.contact_finder.browser = self.browser
-            self.contact_finder.context = self.context
-            self.contact_finder.page = self.page
+            await self.contact_finder.start_page_pool()
             
             logger.info("Browser initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize browser: {str(e)}")
+            logger.error("Failed to initialize browser: %s", e)
             
     async def __aenter__(self):
         """Set up browser context."""
@@ -69,10 +264,31 @@ class BuildingPipeline:
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Clean up browser context."""
-        if hasattr(self, 'browser') and self.browser:
-            await self.browser.close()
-            logger.info("Browser closed")
+        """Clean up browser contexts and HTTP sessions; the shared browser stays up for the next pipeline."""
+        await self.contact_finder.close_page_pool()
+        await self.contact_finder.close_http_session()
+    
+    async def aclose(self):
+        """Close the HTTP clients shared by the pipeline components."""
+        await self.building_enricher.close()
+        try:
+            # The LLMs run on the background loop (via _run_sync), so their
+            # connections are closed there
+            close = self._llm_http_client.aclose()
+            if _LOOP is not None and _LOOP.is_running() and _LOOP is not asyncio.get_running_loop():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(close, _LOOP))
+            else:
+                await close
+        except Exception as e:
+            logger.error("Error closing LLM HTTP client: %s", e)
+        with _LLMS_LOCK:
+            for key in [key for key in _LLMS if key[2] is self._llm_http_client]:
+                del _LLMS[key]
+        if self.openai_client:
+            try:
+                await self.openai_client.close()
+            except Exception as e:
+                logger.error("Error closing OpenAI client: %s", e)
     
     async def process_buildings(self, location: Dict[str, float], search_radius: int = 1000) -> List[Dict[str, Any]]:
         """
@@ -86,42 +302,68 @@ class BuildingPipeline:
             List of processed buildings with enhanced information
         """
         try:
-            # Find buildings using Google Places
-            buildings = await self.building_finder.find_buildings(location, search_radius)
-            print(f"Found {len(buildings)} buildings")
+            # Stream buildings from Google Places and start processing each one as
+            # soon as it arrives, bounded by the enrichment and contact limits
+            enrich_semaphore = asyncio.Semaphore(self.enrich_concurrency)
+            contact_semaphore = asyncio.Semaphore(CONTACT_CONCURRENCY)
+            buildings = []
+            tasks = []
+            try:
+                async for building in self.building_finder.stream_buildings(location, search_radius):
+                    buildings.append(building)
+                    tasks.append(asyncio.ensure_future(
+                        self._process_building_data(building, enrich_semaphore, contact_semaphore)
+                    ))
+            except Exception:
+                for task in tasks:
+                    task.cancel()
+                raise
+            logger.info("Found %s buildings", len(buildings))
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Process each building
             processed_buildings = []
-            for building in buildings:
-                try:
-                    # Enrich building information
-                    enriched = await self.building_enricher.enrich_building(building)
-                    if enriched:
-                        logger.info(f"Calling ContactFinder for address: {enriched.get('address')}")
-                        try:
-                            contact_info = await self.contact_finder.find_contacts(enriched.get('address'))
-                            if contact_info:
-                                enriched.update(contact_info)
-                                
-                                # Store additional contact sources if found
-                                if isinstance(contact_info.get('additional_sources'), list):
-                                    enriched['contact_sources'] = contact_info['additional_sources']
-                        except Exception as contact_error:
-                            logger.error(f"Contact finding failed for {enriched.get('address')}: {str(contact_error)}")
-                            # Continue processing without contact info
-                        
-                        processed_buildings.append(enriched)
-                except Exception as e:
-                    print(f"Error processing building {building.get('name', 'Unknown')}: {str(e)}")
-                    continue
+            for building, result in zip(buildings, results):
+                if isinstance(result, Exception):
+                    logger.error("Error processing building %s: %s", building.get('name', 'Unknown'), result)
+                elif result:
+                    processed_buildings.append(result)
             
-            print(f"Successfully processed {len(processed_buildings)} buildings")
+            logger.info("Successfully processed %s buildings", len(processed_buildings))
             return processed_buildings
             
         except Exception as e:
-            print(f"Error in building pipeline: {str(e)}")
+            logger.error("Error in building pipeline: %s", e)
             return []
     
+    async def _process_building_data(
+        self,
+        building: Dict[str, Any],
+        enrich_semaphore: asyncio.Semaphore,
+        contact_semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """Enrich a found building and attach its contact information."""
+        async with enrich_semaphore:
+            enriched = await self.building_enricher.enrich_building(building)
+        if not enriched:
+            return None
+        
+        logger.info("Calling ContactFinder for address: %s", enriched.get('address'))
+        try:
+            async with contact_semaphore:
+                contact_info = await self._cached_find_contacts(enriched.get('address'))
+            if contact_info:
+                enriched.update(contact_info)
+                
+                # Store additional contact sources if found
+                if isinstance(contact_info.get('additional_sources'), list):
+                    enriched['contact_sources'] = contact_info['additional_sources']
+        except Exception as contact_error:
+            logger.error("Contact finding failed for %s: %s", enriched.get('address'), contact_error)
+            # Continue processing without contact info
+        
+        return enriched
+    
     async def process_bounding_boxes(self, bounding_boxes: List[dict], db: Session):
         """
         Process bounding boxes to find and enrich residential apartment buildings.
@@ -131,225 +373,587 @@ class BuildingPipeline:
             db: Database session
         """
         try:
-            print(f"Processing {len(bounding_boxes)} bounding boxes...")
-            
-            all_buildings = []
-            duplicates_found = 0
+            logger.info("Processing %s bounding boxes...", len(bounding_boxes))
             
-            for bbox in bounding_boxes:
-                print(f"Processing bounding box: {bbox}")
+            # One transaction for the whole run; if the caller already has one
+            # open, work inside a savepoint and leave the outer commit to it
+            transaction = db.begin_nested() if db.in_transaction() else db.begin()
+            with transaction:
+                all_buildings = []
+                pending_sources = {}
+                duplicates_found = 0
                 
-                # Step 1
-                buildings = await self.building_finder.get_buildings_from_bbox(bbox)
+                # Step 1: Find buildings for all bounding boxes concurrently
+                bbox_results = await self._get_buildings_for_bboxes(bounding_boxes)
                 
-                for building_data in buildings:
-                    try:
-                        # Check for duplicates before processing
-                        address = building_data.get('address')
-                        name = building_data.get('name')
-                        
-                        # Get standardized address if available
-                        standardized_address = building_data.get('standardized_address')
-                        
-                        # Query for existing buildings with exact address match
-                        existing_building = db.query(Building).filter(
-                            or_(
-                                Building.address == address,  # Exact match on original address
-                                Building.standardized_address == standardized_address if standardized_address else False,  # Exact match on standardized address
-                                and_(
-                                    Building.name == name,  # Exact match on name
-                                    Building.name != None,
-                                    Building.name != ""
-                                ) if name else False
-                            )
-                        ).first()
-                        
-                        if existing_building:
-                            print(f"\n⚠️ Duplicate building found:")
-                            print(f"  - Address: {address}")
-                            print(f"  - Standardized Address: {standardized_address}")
-                            print(f"  - Name: {name}")
-                            print(f"  - Existing ID: {existing_building.id}")
+                # Drop buildings repeated across overlapping bounding boxes (same
+                # place_id or same canonical address), keeping each one under the
+                # first bounding box (by index) that returned it. This also makes
+                # sure each address is enriched at most once per run.
+                seen_keys = set()
+                bbox_buildings = defaultdict(list)
+                for index, (bbox, buildings) in enumerate(zip(bounding_boxes, bbox_results)):
+                    if isinstance(buildings, Exception):
+                        logger.error("Error finding buildings for bounding box %s: %s", bbox, buildings)
+                        continue
+                    
+                    for building_data in buildings:
+                        keys = {
+                            key for key in (
+                                building_data.get('place_id'),
+                                canonical_address(building_data.get('address'))
+                            ) if key
+                        }
+                        if not keys.isdisjoint(seen_keys):
                             duplicates_found += 1
                             continue
-                            
-                        # Step 2: Enrich building data
-                        enriched_data = await self.building_enricher.enrich_building(building_data)
-                        
-                        # Get the standardized address from enriched data
-                        standardized_address = enriched_data.get('standardized_address')
-                        
-                        # Step 3: Find contact information
-                        print(f"\n🔍 Finding contacts for: {enriched_data.get('name')} at {enriched_data.get('address')}")
-                        contact_info = None
+                        seen_keys.update(keys)
+                        bbox_buildings[index].append(building_data)
+                
+                # Find buildings that are already stored (by address, canonical address,
+                # standardized address or name) with a single query so they are never
+                # enriched again
+                candidate_buildings = [
+                    building_data
+                    for buildings in bbox_buildings.values()
+                    for building_data in buildings
+                ]
+                addresses = {b['address'] for b in candidate_buildings if b.get('address')}
+                standardized_addresses = {b['standardized_address'] for b in candidate_buildings if b.get('standardized_address')}
+                names = {b['name'] for b in candidate_buildings if b.get('name')}
+                canonical_addresses = {canonical_address(address) for address in addresses}
+                canonical_addresses.discard("")
+                
+                existing_addresses = set()
+                existing_standardized_addresses = set()
+                existing_names = set()
+                existing_canonical_addresses = set()
+                if addresses or standardized_addresses or names:
+                    existing_rows = db.execute(_EXISTING_BUILDINGS, {
+                        'addresses': list(addresses),
+                        'canonical_addresses': list(canonical_addresses),
+                        'standardized_addresses': list(standardized_addresses),
+                        'names': list(names)
+                    })
+                    for existing_address, existing_standardized, existing_name, existing_canonical in existing_rows:
+                        existing_addresses.add(existing_address)
+                        if existing_canonical:
+                            existing_canonical_addresses.add(existing_canonical)
+                        if existing_standardized:
+                            existing_standardized_addresses.add(existing_standardized)
+                        if existing_name:
+                            existing_names.add(existing_name)
+                
+                candidates = []
+                for index, bbox in enumerate(bounding_boxes):
+                    buildings = bbox_buildings.get(index)
+                    if not buildings:
+                        continue
+                    
+                    logger.info("Processing bounding box: %s", bbox)
+                    
+                    # Serialized once per bounding box and shared by all its rows
+                    bbox_value = self._bbox_value(bbox)
+                    
+                    for building_data in buildings:
                         try:
-                            contact_info = await self.contact_finder.find_contacts(enriched_data.get('address'))
-                            if contact_info:
-                                print(f"✅ Found contact info:")
-                                print(f"  - Email: {contact_info.get('email')}")
-                                print(f"  - Name: {contact_info.get('name')}")
-                                print(f"  - Phone: {contact_info.get('contact_phone')}")
-                                print(f"  - Title: {contact_info.get('title')}")
-                                print(f"  - Source: {contact_info.get('source')}")
-                                print(f"  - Confidence: {contact_info.get('contact_email_confidence')}")
-                                enriched_data.update(contact_info)
-                            else:
-                                print(f"⚠️ No contact information found")
-                        except Exception as contact_error:
-                            print(f"⚠️ Contact finding failed: {str(contact_error)}")
-                            # Continue processing without contact info
-                        
-                        # Step 4: Save to database
-                        building = Building(
-                            name=enriched_data.get('name'),
-                            address=enriched_data['address'],
-                            standardized_address=enriched_data.get('standardized_address'),
-                            latitude=str(enriched_data.get('latitude')) if enriched_data.get('latitude') else None,
-                            longitude=str(enriched_data.get('longitude')) if enriched_data.get('longitude') else None,
-                            building_type=enriched_data.get('building_type', 'residential_apartment'),
-                            bounding_box=json.dumps({
-                                'north': bbox.get('north'),
-                                'south': bbox.get('south'),
-                                'east': bbox.get('east'),
-                                'west': bbox.get('west')
-                            }),
-                            approved=False,
-                            email_sent=False,
-                            reply_received=False,
-                            
-                            # Contact information
-                            contact_email=contact_info.get('email') if contact_info else None,
-                            contact_name=contact_info.get('name') if contact_info else None,
-                            contact_phone=contact_info.get('contact_phone') if contact_info else None,
-                            website=enriched_data.get('website'),
-                            contact_source=contact_info.get('source') if contact_info else None,
-                            contact_source_url=contact_info.get('source_url') if contact_info else None,
-                            contact_email_confidence=contact_info.get('contact_email_confidence', 0) if contact_info else 0,
-                            contact_verified=contact_info.get('contact_verified', False) if contact_info else False,
-                            verification_notes=contact_info.get('verification_notes') if contact_info else None,
-                            verification_flags=contact_info.get('verification_flags') if contact_info else None,
+                            # Check for duplicates before processing
+                            address = building_data.get('address')
+                            name = building_data.get('name')
+                            standardized_address = building_data.get('standardized_address')
                             
-                            # Basic building info
-                            property_manager=enriched_data.get('property_manager'),
-                            number_of_units=enriched_data.get('number_of_units'),
-                            year_built=enriched_data.get('year_built'),
-                            square_footage=enriched_data.get('square_footage'),
-                            is_coop=enriched_data.get('is_coop', False),
-                            is_mixed_use=enriched_data.get('is_mixed_use', False),
-                            total_apartments=enriched_data.get('total_apartments'),
-                            two_bedroom_apartments=enriched_data.get('two_bedroom_apartments'),
-                            recent_2br_rent=enriched_data.get('recent_2br_rent'),
-                            rent_range_2br=enriched_data.get('rent_range_2br'),
-                            has_laundry=enriched_data.get('has_laundry', False),
-                            laundry_type=enriched_data.get('laundry_type'),
-                            amenities=enriched_data.get('amenities'),
-                            pet_policy=enriched_data.get('pet_policy'),
-                            building_style=enriched_data.get('building_style'),
-                            management_company=enriched_data.get('management_company'),
-                            contact_info=json.dumps(contact_info) if contact_info else None,
-                            recent_availability=enriched_data.get('recent_availability', False),
-                            rental_notes=enriched_data.get('rental_notes'),
-                            neighborhood=enriched_data.get('neighborhood'),
-                            stories=enriched_data.get('stories')
-                        )
-                        
-                        # Save additional contact sources if found
-                        if contact_info and contact_info.get('additional_sources'):
-                            for source in contact_info['additional_sources']:
-                                contact_source = ContactSource(
-                                    building_id=building.id,
-                                    source_type=source.get('source_type', 'unknown'),
-                                    source_url=source.get('source_url'),
-                                    confidence_score=source.get('confidence_score', 0)
+                            if (
+                                address in existing_addresses
+                                or canonical_address(address) in existing_canonical_addresses
+                                or (standardized_address and standardized_address in existing_standardized_addresses)
+                                or (name and name in existing_names)
+                            ):
+                                logger.debug(
+                                    "Duplicate building found: address=%s, standardized_address=%s, name=%s",
+                                    address, standardized_address, name
                                 )
-                                db.add(contact_source)
-                        
-                        db.add(building)
-                        all_buildings.append(building)
+                                duplicates_found += 1
+                                continue
+                            
+                            candidates.append((building_data, bbox_value))
                         
-                    except Exception as e:
-                        print(f"Error processing building {building_data.get('address')}: {str(e)}")
-                        continue
-            
-            # Commit all buildings to database
+                        except Exception as e:
+                            logger.error("Error processing building %s: %s", building_data.get('address'), e)
+                            continue
+                
+                # Steps 2-4: Enrich new buildings and find their contacts concurrently,
+                # while a single consumer inserts the finished rows in chunks
+                queue = asyncio.Queue(maxsize=ROW_QUEUE_SIZE)
+                enrich_semaphore = asyncio.Semaphore(self.enrich_concurrency)
+                contact_semaphore = asyncio.Semaphore(CONTACT_CONCURRENCY)
+                
+                async def produce_rows():
+                    try:
+                        skipped = await asyncio.gather(*(
+                            self._produce_building_row(
+                                building_data, bbox_value, queue, pending_sources,
+                                enrich_semaphore, contact_semaphore,
+                                existing_standardized_addresses
+                            )
+                            for building_data, bbox_value in candidates
+                        ))
+                        return sum(skipped)
+                    finally:
+                        # End of stream, even if producing failed; when the queue
+                        # is full the consumer notices this task is done instead
+                        with contextlib.suppress(asyncio.QueueFull):
+                            queue.put_nowait(None)
+                
+                producer = asyncio.ensure_future(produce_rows())
+                try:
+                    queued_rows = await self._consume_building_rows(queue, db, all_buildings, producer)
+                    duplicates_found += queued_rows - len(all_buildings) + await producer
+                finally:
+                    if not producer.done():
+                        producer.cancel()
+                
+                # Attach contact sources by address now that the buildings have ids
+                if all_buildings:
+                    source_rows = [
+                        {
+                            'building_id': building.id,
+                            'source_type': source.get('source_type', 'unknown'),
+                            'source_url': source.get('source_url'),
+                            'confidence_score': source.get('confidence_score', 0)
+                        }
+                        for building in all_buildings
+                        for source in pending_sources.get(building.address, [])
+                    ]
+                    if source_rows:
+                        db.execute(insert(ContactSource), source_rows)
+                    
+                    with_contact = with_email = with_phone = 0
+                    for b in all_buildings:
+                        email, phone = b.contact_email, b.contact_phone
+                        if email:
+                            with_email += 1
+                        if phone:
+                            with_phone += 1
+                        if email or phone or b.contact_name:
+                            with_contact += 1
+                
+                self._flush_contact_cache(db)
+                self.building_enricher.flush_geocode_cache(db)
+
             if all_buildings:
-                db.commit()
-                print(f"\n✅ Successfully processed {len(all_buildings)} buildings")
-                print(f"  - Buildings with contact info: {sum(1 for b in all_buildings if b.contact_email or b.contact_name or b.contact_phone)}")
-                print(f"  - Buildings with email: {sum(1 for b in all_buildings if b.contact_email)}")
-                print(f"  - Buildings with phone: {sum(1 for b in all_buildings if b.contact_phone)}")
+                logger.info("Successfully processed %s buildings", len(all_buildings))
+                logger.info("  - Buildings with contact info: %s", with_contact)
+                logger.info("  - Buildings with email: %s", with_email)
+                logger.info("  - Buildings with phone: %s", with_phone)
                 if duplicates_found > 0:
-                    print(f"  - Skipped {duplicates_found} duplicate buildings")
+                    logger.info("  - Skipped %s duplicate buildings", duplicates_found)
             else:
-                print("No new buildings were processed")
+                logger.info("No new buildings were processed")
             
             return all_buildings
             
         except Exception as e:
-            print(f"Error in building pipeline: {str(e)}")
-            db.rollback()
+            logger.error("Error in building pipeline: %s", e)
             raise e
     
-    async def process_approved_building(self, building_id: int, db: Session):
+    def _bbox_value(self, bbox: Any) -> Dict[str, float]:
+        """Build the bounding_box column value for a bounding box (dict or Pydantic model)."""
+        # Convert bbox to dict if it's a Pydantic model
+        if hasattr(bbox, 'dict'):
+            bbox = bbox.dict()
+        return {
+            'north': bbox.get('north'),
+            'south': bbox.get('south'),
+            'east': bbox.get('east'),
+            'west': bbox.get('west')
+        }
+    
+    async def _get_buildings_for_bboxes(self, bounding_boxes: List[dict]) -> List[Any]:
         """
-        Process an approved building through the contact finding and email sending pipeline.
+        Look up buildings for every bounding box concurrently.
+        
+        Returns one entry per bounding box, in order: either the list of
+        buildings found or the exception raised for that box.
+        """
+        semaphore = asyncio.Semaphore(BBOX_CONCURRENCY)
+        
+        async def get_buildings(bbox):
+            async with semaphore:
+                return await self.building_finder.get_buildings_from_bbox(bbox)
+        
+        return await asyncio.gather(
+            *(get_buildings(bbox) for bbox in bounding_boxes),
+            return_exceptions=True
+        )
+    
+    async def _enrich_safe(self, building_data: Dict[str, Any], semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """Enrich a building under the given semaphore, returning None on failure."""
+        async with semaphore:
+            try:
+                return await self.building_enricher.enrich_building(building_data)
+            except Exception as e:
+                logger.error("Error enriching building %s: %s", building_data.get('address'), e)
+                return None
+    
+    async def _find_contacts_safe(self, address: Optional[str], semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """Find contacts for an address under the given semaphore, returning None on failure."""
+        logger.debug("Finding contacts for: %s", address)
+        try:
+            async with semaphore:
+                return await self._cached_find_contacts(address)
+        except Exception as contact_error:
+            logger.warning("Contact finding failed: %s", contact_error)
+            # Continue processing without contact info
+            return None
+    
+    async def _cached_find_contacts(self, address: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Find contacts for an address, checking the in-memory and persistent
+        contact caches before running a browser lookup.
+        
+        Only results that found someone to contact are persisted; empty
+        lookups stay in the in-memory cache for its shorter negative TTL.
+        """
+        key = canonical_address(address)
+        if not key:
+            return await self.contact_finder.find_contacts(address)
+        
+        contact_info = get_cached_contacts(address)
+        if contact_info is None:
+            # Single flight: concurrent callers for the same address share one
+            # lookup, which is cancelled only once every caller has given up
+            loop_inflight = self._contact_inflight.setdefault(asyncio.get_running_loop(), {})
+            inflight = loop_inflight.get(key)
+            if inflight is None or inflight[0].cancelled():
+                task = asyncio.ensure_future(self._lookup_contacts(key, address))
+                inflight = loop_inflight[key] = [task, 0]
+                task.add_done_callback(lambda _, entry=inflight: self._forget_inflight(loop_inflight, key, entry))
+            task = inflight[0]
+            inflight[1] += 1
+            try:
+                contact_info = await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if inflight[1] == 1:
+                    # Forget the lookup now so a later caller starts a new one
+                    # instead of joining the cancelled task
+                    task.cancel()
+                    self._forget_inflight(loop_inflight, key, inflight)
+                raise
+            finally:
+                inflight[1] -= 1
+        
+        return dict(contact_info) if contact_info else contact_info
+    
+    @staticmethod
+    def _forget_inflight(loop_inflight: Dict[str, list], key: str, entry: list):
+        """Drop an in-flight lookup entry unless a newer lookup has replaced it."""
+        if loop_inflight.get(key) is entry:
+            del loop_inflight[key]
+    
+    async def _lookup_contacts(self, key: str, address: str) -> Optional[Dict[str, Any]]:
+        """Load contacts for a canonical address from the contact_cache table or the browser."""
+        loop = asyncio.get_running_loop()
+        contact_info = await loop.run_in_executor(None, load_cached_contacts, key)
+        if contact_info is None:
+            contact_info = await self.contact_finder.find_contacts(address)
+            if has_contact(contact_info):
+                self._pending_contact_cache[key] = contact_info
+        else:
+            cache_contacts(address, contact_info)
+        return contact_info
+    
+    def _flush_contact_cache(self, db: Session):
+        """Write contact lookups found since the last flush to the contact_cache table."""
+        while self._pending_contact_cache:
+            key, payload = self._pending_contact_cache.popitem()
+            db.merge(ContactCache(address_norm=key, payload=payload))
+    
+    async def _produce_building_row(
+        self,
+        building_data: Dict[str, Any],
+        bbox_value: Dict[str, float],
+        queue: asyncio.Queue,
+        pending_sources: Dict[str, List[dict]],
+        enrich_semaphore: asyncio.Semaphore,
+        contact_semaphore: asyncio.Semaphore,
+        known_standardized_addresses: set
+    ) -> bool:
+        """
+        Enrich a building, find its contacts and queue the results for insertion.
+        
+        Returns True if the building turned out to be a duplicate once its address
+        was standardized (matching a stored building or one earlier in this run).
+        """
+        # Contacts only need the address, so look them up while enrichment runs
+        address = building_data.get('address')
+        contact_task = asyncio.ensure_future(self._find_contacts_safe(address, contact_semaphore))
+        enriched_data = await self._enrich_safe(building_data, enrich_semaphore)
+        if enriched_data is None:
+            contact_task.cancel()
+            return False
+        
+        # Standardization can reveal a duplicate the raw address didn't; drop it
+        # before its contact lookup (likely still waiting on the semaphore) runs
+        standardized_address = enriched_data.get('standardized_address')
+        if standardized_address:
+            if standardized_address in known_standardized_addresses:
+                contact_task.cancel()
+                logger.debug("Duplicate building after standardization: %s", standardized_address)
+                return True
+            known_standardized_addresses.add(standardized_address)
+        
+        contact_info = await contact_task
+        if enriched_data.get('address') != address:
+            contact_info = await self._find_contacts_safe(enriched_data.get('address'), contact_semaphore)
+        
+        try:
+            if contact_info:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Found contact info: email=%s, name=%s, phone=%s, title=%s, source=%s, confidence=%s",
+                        contact_info.get('email'), contact_info.get('name'), contact_info.get('contact_phone'),
+                        contact_info.get('title'), contact_info.get('source'),
+                        contact_info.get('contact_email_confidence')
+                    )
+                enriched_data.update(contact_info)
+            else:
+                logger.debug("No contact information found")
+            
+            # Keep additional contact sources until the building has an id
+            if contact_info and contact_info.get('additional_sources'):
+                pending_sources[enriched_data['address']] = contact_info['additional_sources']
+            
+        except Exception as e:
+            logger.error("Error processing building %s: %s", enriched_data.get('address'), e)
+            return False
+        
+        await queue.put((enriched_data, contact_info, bbox_value))
+        return False
+    
+    async def _consume_building_rows(
+        self, queue: asyncio.Queue, db: Session, inserted_buildings: List[Building], producer: asyncio.Future
+    ) -> int:
+        """
+        Drain finished buildings from the queue and bulk insert them in chunks until the end-of-stream None.
+        Returns the number of buildings consumed; rows skipped as conflicts don't appear in inserted_buildings.
+        
+        Stops early if the producer task fails, leaving the caller to await it
+        and see the error, so a failed producer can never leave this waiting.
+        
+        Row building and inserts run in the default executor so neither the
+        per-row work nor the blocking DB round trip stalls the enrichment and
+        contact lookups still in flight. The session is only ever used by one
+        thread at a time since each flush is awaited.
+        """
+        loop = asyncio.get_running_loop()
+        chunk = []
+        consumed = 0
+        while True:
+            if producer.done():
+                if producer.cancelled() or producer.exception():
+                    # The caller rolls back when it awaits the producer, so skip the rest
+                    return consumed
+                if queue.empty():
+                    break
+                item = queue.get_nowait()
+            else:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait((getter, producer), return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    continue
+                item = getter.result()
+            if item is None:
+                break
+            chunk.append(item)
+            consumed += 1
+            if len(chunk) >= INSERT_CHUNK_SIZE:
+                await loop.run_in_executor(None, self._insert_buildings, db, chunk, inserted_buildings)
+        
+        if chunk:
+            await loop.run_in_executor(None, self._insert_buildings, db, chunk, inserted_buildings)
+        
+        return consumed
+    
+    def _building_row(self, enriched_data: Dict[str, Any], contact_info: Optional[Dict[str, Any]], bbox_value: Dict[str, float]) -> Dict[str, Any]:
+        """Build the buildings table row for an enriched building."""
+        get = enriched_data.get
+        row = {column: get(key, default) for column, key, default in _ENRICHED_FIELDS}
+        row['address'] = enriched_data['address']
+        row['canonical_address'] = canonical_address(enriched_data['address']) or None
+        row['bounding_box'] = bbox_value
+        row['approved'] = False
+        row['email_sent'] = False
+        row['reply_received'] = False
+        
+        if contact_info:
+            get = contact_info.get
+            row.update({column: get(key, default) for column, key, default in _CONTACT_FIELDS})
+            row['contact_info'] = contact_info
+        else:
+            row.update({column: default for column, _, default in _CONTACT_FIELDS})
+            row['contact_info'] = None
+        
+        return row
+    
+    def _insert_buildings(self, db: Session, chunk: List[tuple], inserted_buildings: List[Building]):
+        """
+        Build rows for a chunk of (enriched_data, contact_info, bounding box) items, bulk
+        insert them, collect the new Buildings and clear the chunk for reuse.
+        """
+        mappings = [self._building_row(*item) for item in chunk]
+        chunk.clear()
+        if len(mappings) >= COPY_CHUNK_SIZE and supports_copy(db):
+            # COPY can't skip conflicts or return rows, so drop rows that are
+            # already stored first and load the copied buildings back by address
+            mappings = self._without_stored_buildings(db, mappings)
+            copy_rows(db, Building.__table__, mappings)
+            inserted_buildings.extend(
+                db.query(Building).filter(Building.address.in_([m['address'] for m in mappings]))
+            )
+        else:
+            statement = _BUILDING_UPSERTS.get(db.get_bind().dialect.name, _BUILDING_INSERT)
+            inserted_buildings.extend(db.scalars(statement, mappings))
+    
+    def _without_stored_buildings(self, db: Session, mappings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop building rows that share a unique key with a stored building or an earlier row."""
+        keys = ('address', 'standardized_address', 'name', 'canonical_address')
+        taken = {key: set() for key in keys}
+        existing_rows = db.execute(_EXISTING_BUILDINGS, {
+            'addresses': [m['address'] for m in mappings],
+            'canonical_addresses': [m['canonical_address'] for m in mappings if m['canonical_address']],
+            'standardized_addresses': [m['standardized_address'] for m in mappings if m['standardized_address']],
+            'names': [m['name'] for m in mappings if m['name']]
+        })
+        for row in existing_rows:
+            for key, value in zip(keys, row):
+                if value:
+                    taken[key].add(value)
+        
+        rows = []
+        for mapping in mappings:
+            if any(mapping[key] and mapping[key] in taken[key] for key in keys):
+                continue
+            for key in keys:
+                if mapping[key]:
+                    taken[key].add(mapping[key])
+            rows.append(mapping)
+        return rows
+    
+    async def process_approved_buildings(self, building_ids: List[int], db: Session) -> List[int]:
+        """
+        Process a batch of approved buildings through the contact finding pipeline.
         
         Args:
-            building_id: ID of the approved building
+            building_ids: IDs of the approved buildings
             db: Database session
+            
+        Returns:
+            IDs of the buildings that were found and processed
         """
+        # This runs as a FastAPI background task on the server's event loop, so
+        # the blocking session work is done in the default executor
+        loop = asyncio.get_running_loop()
         try:
-            # Get the building
-            building = db.query(Building).filter(Building.id == building_id).first()
-            if not building:
-                raise Exception(f"Building with ID {building_id} not found")
+            # Only the id and address are needed to look up contacts, so fetch
+            # plain rows in one query instead of hydrating Building objects
+            buildings = await loop.run_in_executor(
+                None,
+                lambda: db.query(Building.id, Building.address).filter(Building.id.in_(building_ids)).all()
+            )
+            found_ids = [building.id for building in buildings]
+            missing_ids = set(building_ids) - set(found_ids)
+            if missing_ids:
+                logger.warning("Approved buildings not found: %s", sorted(missing_ids))
             
-            print(f"Processing approved building: {building.address}")
+            logger.info("Processing %s approved buildings", len(buildings))
             
             # Step 1: Find contact information with emphasis on building manager/realtor
-            contact_info = await self.contact_finder.find_contacts(building.get('address'))
+            semaphore = asyncio.Semaphore(CONTACT_CONCURRENCY)
             
-            if contact_info:
-                # Update building with contact information
-                building.contact_email = contact_info.get('email')
-                building.contact_name = contact_info.get('name')
-                building.property_manager = contact_info.get('title') or contact_info.get('property_manager')
-                building.contact_source = contact_info.get('source')
-                building.contact_source_url = contact_info.get('source_url')
-                building.contact_email_confidence = contact_info.get('contact_email_confidence')
-                building.contact_verified = contact_info.get('contact_verified', False)
-                building.verification_notes = contact_info.get('verification_notes')
-                building.verification_flags = contact_info.get('verification_flags')
+            async def find_contacts(building):
+                async with semaphore:
+                    return await self._cached_find_contacts(building.address)
+            
+            results = await asyncio.gather(
+                *(find_contacts(building) for building in buildings),
+                return_exceptions=True
+            )
+            
+            # Step 2: Update all buildings with their contact information at once
+            updates = []
+            source_rows = []
+            for building, contact_info in zip(buildings, results):
+                if isinstance(contact_info, Exception):
+                    logger.error("Error finding contacts for %s: %s", building.address, contact_info)
+                    continue
+                if not contact_info:
+                    logger.warning("No contact found for building: %s", building.address)
+                    continue
+                
+                updates.append({
+                    'id': building.id,
+                    'contact_email': contact_info.get('email'),
+                    'contact_name': contact_info.get('name'),
+                    'property_manager': contact_info.get('title') or contact_info.get('property_manager'),
+                    'contact_source': contact_info.get('source'),
+                    'contact_source_url': contact_info.get('source_url'),
+                    'contact_email_confidence': contact_info.get('contact_email_confidence'),
+                    'contact_verified': contact_info.get('contact_verified', False),
+                    'verification_notes': contact_info.get('verification_notes'),
+                    'verification_flags': contact_info.get('verification_flags')
+                })
                 
                 # Store additional contact sources if found
                 if isinstance(contact_info.get('additional_sources'), list):
                     for source in contact_info['additional_sources']:
-                        contact_source = ContactSource(
-                            building_id=building.id,
-                            source_type=source.get('source_type', 'unknown'),
-                            source_url=source.get('source_url'),
-                            confidence_score=source.get('confidence_score', 0)
-                        )
-                        db.add(contact_source)
+                        source_rows.append({
+                            'building_id': building.id,
+                            'source_type': source.get('source_type', 'unknown'),
+                            'source_url': source.get('source_url'),
+                            'confidence_score': source.get('confidence_score', 0)
+                        })
                 
-                db.commit()
-                print(f"Found contact: {building.contact_email}")
-            else:
-                print(f"No contact found for building: {building.address}")
-                return
+                logger.debug("Found contact for %s: %s", building.address, contact_info.get('email'))
+            
+            if updates:
+                await loop.run_in_executor(None, self._save_approved_contacts, db, updates, source_rows)
+            
+            return found_ids
             
         except Exception as e:
-            print(f"Error processing approved building: {str(e)}")
-            db.rollback()
+            logger.error("Error processing approved buildings: %s", e)
+            await loop.run_in_executor(None, db.rollback)
             raise e
     
+    def _save_approved_contacts(self, db: Session, updates: List[dict], source_rows: List[dict]):
+        """Write approved buildings' contact fields and sources, then commit."""
+        # ORM bulk UPDATE by primary key, executed as a single executemany
+        db.execute(update(Building), updates)
+        if source_rows:
+            db.execute(insert(ContactSource), source_rows)
+        self._flush_contact_cache(db)
+        db.commit()
+    
+    async def process_approved_building(self, building_id: int, db: Session):
+        """
+        Process an approved building through the contact finding and email sending pipeline.
+        
+        Args:
+            building_id: ID of the approved building
+            db: Database session
+        """
+        found_ids = await self.process_approved_buildings([building_id], db)
+        if not found_ids:
+            raise Exception(f"Building with ID {building_id} not found")
+    
     def process_bounding_boxes_sync(self, bounding_boxes: List[dict], db: Session):
         """Synchronous wrapper for async bounding box processing."""
-        return asyncio.run(self.process_bounding_boxes(bounding_boxes, db))
+        return _run_sync(self.process_bounding_boxes(bounding_boxes, db))
     
     def process_approved_building_sync(self, building_id: int, db: Session):
         """Synchronous wrapper for async approved building processing."""
-        return asyncio.run(self.process_approved_building(building_id, db))
+        return _run_sync(self.process_approved_building(building_id, db))
     
     async def process_building(self, building: Dict[str, Any], bbox: BoundingBox, db: Session) -> Optional[Dict[str, Any]]:
         """Process a single building through the pipeline."""
@@ -357,25 +961,26 @@ class BuildingPipeline:
             # Step 1: Enrich building data
             enriched_data = await self.building_enricher.enrich_building(building)
             if not enriched_data:
-                logger.warning(f"Failed to enrich building data for {building.get('address')}")
+                logger.warning("Failed to enrich building data for %s", building.get('address'))
                 return None
                 
             # Step 2: Only find contacts if building was successfully enriched
             if enriched_data.get('ai_building_type') != 'unknown' and enriched_data.get('ai_confidence') != 'error':
                 try:
-                    contact_info = await self.contact_finder.find_contacts(enriched_data['address'])
+                    contact_info = await self._cached_find_contacts(enriched_data['address'])
                     if contact_info:
                         enriched_data['contact_info'] = contact_info
                 except Exception as e:
-                    logger.error(f"Error finding contacts for {enriched_data['address']}: {str(e)}")
+                    logger.error("Error finding contacts for %s: %s", enriched_data['address'], e)
                     # Continue processing even if contact finding fails
             else:
-                logger.info(f"Skipping contact finding for unenriched building: {enriched_data['address']}")
+                logger.info("Skipping contact finding for unenriched building: %s", enriched_data['address'])
             
             # Step 3: Save to database
             try:
                 building_model = Building(
                     address=enriched_data['address'],
+                    canonical_address=canonical_address(enriched_data['address']) or None,
                     name=enriched_data.get('name'),
                     building_type=enriched_data.get('building_type'),
                     website=enriched_data.get('website'),
@@ -399,15 +1004,16 @@ class BuildingPipeline:
                     is_residential_confirmed=enriched_data.get('is_residential_confirmed', False)
                 )
                 db.add(building_model)
+                self.building_enricher.flush_geocode_cache(db)
                 db.commit()
                 db.refresh(building_model)
-                logger.info(f"Successfully saved building to database: {enriched_data['address']}")
+                logger.info("Successfully saved building to database: %s", enriched_data['address'])
                 return enriched_data
             except Exception as e:
-                logger.error(f"Error saving building to database: {str(e)}")
+                logger.error("Error saving building to database: %s", e)
                 db.rollback()
                 return None
                 
         except Exception as e:
-            logger.error(f"Error processing building {building.get('address')}: {str(e)}")
+            logger.error("Error processing building %s: %s", building.get('address'), e)
             return None 
\ No newline at end of file
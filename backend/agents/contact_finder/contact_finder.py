@@ -4,99 +4,540 @@ Uses Puppeteer for web scraping and automation.
 """
 
 import asyncio
+import importlib.util
 import json
+import os
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlencode, urljoin, urlparse, urlsplit, urlunsplit
 import aiohttp
+from aiohttp.resolver import AsyncResolver
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright, Browser, Page
 
+from ..utils.address import canonical_address
+from ..utils.rate_limiter import contact_limiter
+from ..utils.ttl_cache import TTLCache
+
+# lxml's C parser is several times faster than the pure-Python html.parser
+_HTML_PARSER = 'lxml' if importlib.util.find_spec("lxml") is not None else 'html.parser'
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of browser pages (each in its own context) available for concurrent lookups
+PAGE_POOL_SIZE = 4
+
+# Maximum number of a website's contact/leasing pages loaded at the same time
+CONTACT_PAGE_CONCURRENCY = 5
+
+# Maximum number of distinct contact/leasing pages visited per website, and
+# path segments of matching links that are never worth visiting
+MAX_CONTACT_PAGES = 6
+_SKIPPED_PATH_SEGMENTS = frozenset(('careers', 'jobs', 'blog', 'news', 'press'))
+
+
+def _canonical_url(url: str) -> Optional[str]:
+    """
+    Reduce a link to the page it loads: lowercase host, no trailing slash,
+    fragment or utm_* tracking parameters. Returns None for links that aren't
+    worth visiting (mailto:/tel:/javascript:, careers, blog, ...).
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https'):
+        return None
+    path = parts.path.rstrip('/') or '/'
+    if any(segment.lower() in _SKIPPED_PATH_SEGMENTS for segment in path.split('/')):
+        return None
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_')
+    ))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, query, ''))
+
+
+def _unique_pages(urls: List[str]) -> List[str]:
+    """Canonicalize links, dropping duplicates and skipped pages, up to MAX_CONTACT_PAGES."""
+    pages = []
+    seen = set()
+    for url in urls:
+        canonical = _canonical_url(url)
+        if canonical is None or canonical in seen:
+            continue
+        seen.add(canonical)
+        pages.append(canonical)
+        if len(pages) >= MAX_CONTACT_PAGES:
+            break
+    return pages
+
+# Aggregator/social domains never treated as a manager's website (subdomains included)
+_SPAM_DOMAINS = frozenset((
+    'yelp.com', 'facebook.com', 'linkedin.com', 'yellowpages.com',
+    'instagram.com', 'twitter.com', 'x.com'
+))
+
+# Snippet words suggesting a result is a property management company's site
+_MANAGEMENT_KEYWORDS = ('management', 'leasing', 'realty')
+
+# DuckDuckGo's static HTML results page, tried before a browser Google search
+DUCKDUCKGO_HTML_URL = "https://html.duckduckgo.com/html/"
+
+# Timeout in seconds for probing guessed company domains
+DOMAIN_GUESS_TIMEOUT = 3
+
+# Company name suffixes dropped before guessing a domain from the name
+_COMPANY_SUFFIX_RE = re.compile(r'\b(?:llc|l\.l\.c|inc|corp|corporation|co|ltd|lp|llp)\b\.?', re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+# Local parts marking an email as a leasing contact
+_LEASING_KEYWORDS = ('leasing', 'rentals')
+
+
+def _is_spam_domain(domain: str) -> bool:
+    """Check if a lowercased host is (or is a subdomain of) an aggregator/social domain."""
+    if domain in _SPAM_DOMAINS:
+        return True
+    parts = domain.split('.')
+    return any('.'.join(parts[i:]) in _SPAM_DOMAINS for i in range(1, len(parts) - 1))
+
+
+# Navigations only wait for the DOM (not images, fonts or trackers), up to this many ms
+NAVIGATION_TIMEOUT = 15000
+
+# Time budgets in seconds for each lookup step and for a whole lookup, so one
+# hung site can't hold a pooled page for minutes
+OWNER_LOOKUP_TIMEOUT = 20
+WEBSITE_SEARCH_TIMEOUT = 20
+WEBSITE_SCRAPE_TIMEOUT = 25
+FIND_CONTACTS_TIMEOUT = 60
+
+
+async def _bounded(coro, timeout: float, step: str):
+    """Await a lookup step, returning None if it takes longer than its budget."""
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        logger.warning("%s timed out after %ss", step, timeout)
+        return None
+
+
+# Resource types never loaded by pooled pages; emails and links don't need them
+_BLOCKED_RESOURCE_TYPES = frozenset(('image', 'media', 'font', 'stylesheet'))
+
+
+async def _block_heavy_resources(route):
+    """Abort requests for resources the scrapers don't need."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Email addresses in page text; the TLD must be letters so strings like
+# "lib@1.2.3" don't match
+_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,24}')
+
+# Link text marking a website's contact/leasing pages and its contact form
+_CONTACT_PAGE_KEYWORDS = ('contact', 'leasing', 'about', 'rent')
+_CONTACT_FORM_KEYWORDS = ('contact', 'message', 'inquiry')
+
+# Static fetches: timeout in seconds, and the minimum visible text (in characters)
+# for a page to count as server-rendered rather than a JavaScript shell
+STATIC_FETCH_TIMEOUT = 5
+STATIC_MIN_TEXT_LENGTH = 200
+
+# Page-side extractors, registered on every pooled context with add_init_script so
+# the JS is compiled once per page load and each call is a short evaluate by name
+_EXTRACTORS_JS = r'''
+window.__extractOwnerInfo = () => {
+    const selectors = {
+        owner: ['.owner-name', '.owner', '.property-owner', '[data-testid="owner-name"]'],
+        manager: ['.manager-name', '.manager', '.property-manager', '[data-testid="manager-name"]']
+    };
+
+    const getText = (selectors) => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element) return element.textContent.trim();
+        }
+        return null;
+    };
+
+    return {
+        owner: getText(selectors.owner),
+        manager: getText(selectors.manager)
+    };
+};
+
+window.__extractSearchResults = () => {
+    const results = [];
+    document.querySelectorAll('div.g').forEach(div => {
+        const link = div.querySelector('a');
+        if (link) {
+            results.push({
+                url: link.href,
+                domain: link.hostname.toLowerCase(),
+                title: link.textContent,
+                snippet: div.querySelector('.VwiC3b')?.textContent
+            });
+        }
+    });
+    return results;
+};
+
+window.__extractContactLinks = () => {
+    const links = [];
+    const keywords = ['contact', 'leasing', 'about', 'rent'];
+    document.querySelectorAll('a').forEach(a => {
+        const text = a.textContent.toLowerCase();
+        const href = a.href;
+        if (keywords.some(k => text.includes(k)) && href) {
+            links.push(href);
+        }
+    });
+    return links;
+};
+
+window.__extractContactForm = () => {
+    const keywords = ['contact', 'message', 'inquiry'];
+    for (const a of document.querySelectorAll('a')) {
+        const text = a.textContent.toLowerCase();
+        const href = a.href;
+        if (keywords.some(k => text.includes(k)) && href) {
+            return href;
+        }
+    }
+    return null;
+};
+
+window.__extractPageContacts = () => {
+    // Rendered text plus mailto: link targets; scripts, styles and markup are skipped
+    const mailtos = [];
+    for (const a of document.querySelectorAll('a[href^="mailto:"]')) {
+        try {
+            mailtos.push(decodeURIComponent(a.href.slice(7).split('?')[0]));
+        } catch (e) {}
+    }
+    const text = (document.body ? document.body.innerText : '') + ' ' + mailtos.join(' ');
+    const emails = text.match(/[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,24}/g) || [];
+    return {
+        emails: [...new Set(emails)],
+        contactForm: window.__extractContactForm()
+    };
+};
+'''
+
+# NYC geocoder (address -> BBL) and the Who Owns What API behind JustFix's site
+GEOSEARCH_URL = "https://geosearch.planninglabs.nyc/v2/search"
+JUSTFIX_API_URL = os.getenv("JUSTFIX_API_URL", "https://wow-django.justfix.org/api/address")
+
+# HPD registration contact titles, in order of preference
+_OWNER_TITLES = ('CorporateOwner', 'IndividualOwner', 'JointOwner', 'HeadOfficer')
+_MANAGER_TITLES = ('Agent', 'SiteManager', 'Officer')
+
+# Lookup results shared by every ContactFinder, keyed by canonical address.
+# Lookups that found no owner expire sooner so they are retried the same day.
+CONTACT_CACHE_SIZE = 10_000
+CONTACT_CACHE_TTL = 24 * 3600
+EMPTY_CONTACT_CACHE_TTL = 3600
+_CONTACT_CACHE = TTLCache(maxsize=CONTACT_CACHE_SIZE)
+
+# Playwright driver and Chromium shared by every ContactFinder, launched once per
+# event loop (Playwright objects can't be used from a loop other than the one
+# that started them) and kept warm for the life of the process
+_BROWSERS: Dict[asyncio.AbstractEventLoop, Tuple[Any, Browser]] = {}
+_BROWSER_LOCKS: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+
+async def get_shared_browser() -> Browser:
+    """Return the shared headless browser for the running loop, launching it on first use."""
+    loop = asyncio.get_running_loop()
+    async with _BROWSER_LOCKS.setdefault(loop, asyncio.Lock()):
+        entry = _BROWSERS.get(loop)
+        if entry is None or not entry[1].is_connected():
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch(
+                headless=True, args=['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
+            )
+            entry = _BROWSERS[loop] = (playwright, browser)
+        return entry[1]
+
+
+async def close_shared_browser():
+    """Close the running loop's shared browser and Playwright driver, if they were started."""
+    loop = asyncio.get_running_loop()
+    _BROWSER_LOCKS.pop(loop, None)
+    entry = _BROWSERS.pop(loop, None)
+    if entry is None:
+        return
+    playwright, browser = entry
+    try:
+        await browser.close()
+    except Exception as e:
+        logger.error("Error closing browser: %s", e)
+    try:
+        await playwright.stop()
+    except Exception as e:
+        logger.error("Error stopping playwright: %s", e)
+
+
+def get_cached_contacts(address: str) -> Optional[Dict]:
+    """Return an address's live lookup from the shared in-memory cache, or None."""
+    return _CONTACT_CACHE.get(canonical_address(address))
+
+
+def cache_contacts(address: str, contact_info: Dict):
+    """Put a lookup loaded from elsewhere (e.g. the contact_cache table) in the shared in-memory cache."""
+    _CONTACT_CACHE.set(canonical_address(address), contact_info, CONTACT_CACHE_TTL)
+
+
+def invalidate_cached_contacts(address: str) -> bool:
+    """Drop an address's lookup from the shared in-memory cache, returning whether it was cached."""
+    return _CONTACT_CACHE.pop(canonical_address(address)) is not None
+
+
 class ContactFinder:
     """Autonomous agent for finding building contacts in NYC."""
     
-    def __init__(self, browser=None, context=None, page=None):
+    def __init__(self, browser=None, context=None, page=None, pool_size: int = PAGE_POOL_SIZE):
         """Initialize the contact finder."""
         self.browser = browser
         self.context = context
         self.page = page
-        self.cache = {}  # Simple in-memory cache
-        self._playwright = None
+        self.pool_size = pool_size
+        self._pages: Optional[asyncio.Queue] = None
+        self._pool_contexts = []
+        self._session: Optional[aiohttp.ClientSession] = None
         
     async def __aenter__(self):
-        """Set up browser context if not provided."""
+        """Set up the page pool, on the shared browser if none was provided."""
         if not self.browser:
             try:
-                self._playwright = await async_playwright().start()
-                self.browser = await self._playwright.chromium.launch(headless=True)
-                self.context = await self.browser.new_context()
-                self.page = await self.context.new_page()
+                self.browser = await get_shared_browser()
             except Exception as e:
-                logger.error(f"Failed to initialize browser: {str(e)}")
+                logger.error("Failed to initialize browser: %s", e)
                 return self
+        await self.start_page_pool()
         return self
+    
+    async def start_page_pool(self):
+        """
+        Fill the page pool from the browser, reusing self.page (if one was
+        passed in) as its first page.
         
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Clean up browser context if we created it."""
-        if self.browser:
-            try:
-                await self.browser.close()
-            except Exception as e:
-                logger.error(f"Error closing browser: {str(e)}")
-        if self._playwright:
+        Each pooled page gets its own context so concurrent lookups don't share
+        cookies or navigation state.
+        """
+        if self._pages is not None or not self.browser:
+            return
+        
+        pages = asyncio.Queue()
+        if self.page:
+            await self.page.context.add_init_script(script=_EXTRACTORS_JS)
+            pages.put_nowait(self.page)
+        try:
+            while pages.qsize() < self.pool_size:
+                context = await self.browser.new_context()
+                self._pool_contexts.append(context)
+                await context.add_init_script(script=_EXTRACTORS_JS)
+                await context.route('**/*', _block_heavy_resources)
+                pages.put_nowait(await context.new_page())
+        except Exception as e:
+            logger.error("Failed to open pooled page: %s", e)
+        
+        if not pages.empty():
+            self._pages = pages
+    
+    @asynccontextmanager
+    async def page_pool(self):
+        """
+        Borrow a page from the pool for the duration of the block.
+        
+        The page is reset to about:blank before it goes back, so the previous
+        site's scripts and timers stop running while it waits for the next
+        lookup; a page that was closed is replaced from its context.
+        """
+        page = await self._pages.get()
+        try:
+            yield page
+        finally:
             try:
-                await self._playwright.stop()
+                if page.is_closed():
+                    page = await page.context.new_page()
+                else:
+                    await page.goto('about:blank', timeout=NAVIGATION_TIMEOUT)
             except Exception as e:
-                logger.error(f"Error stopping playwright: {str(e)}")
+                logger.warning("Error resetting pooled page: %s", e)
+            self._pages.put_nowait(page)
+        
+    async def close_page_pool(self):
+        """Close the contexts opened for the page pool, leaving the browser running."""
+        if self._pool_contexts:
+            await asyncio.gather(
+                *(context.close() for context in self._pool_contexts),
+                return_exceptions=True
+            )
+            self._pool_contexts = []
+        self._pages = None
+        
+    async def close_http_session(self):
+        """Close the HTTP session used for static page fetches, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the page pool's contexts and the HTTP session; the shared browser stays warm."""
+        await self.close_page_pool()
+        await self.close_http_session()
             
     async def find_contacts(self, address: str) -> Dict:
-        logger.info(f"ContactFinder.find_contacts called with address: {address}")
+        logger.debug("ContactFinder.find_contacts called with address: %s", address)
         try:
             # Check cache first
-            if address in self.cache:
-                logger.info(f"Using cached results for {address}")
-                return self.cache[address]
+            cache_key = canonical_address(address)
+            cached = _CONTACT_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached results for %s", address)
+                return cached
             
             # If browser is not initialized, return empty result
-            if not self.page:
+            if self._pages is None:
                 logger.warning("Browser not initialized, skipping contact finding")
                 return self._create_empty_result(address)
             
-            # Step 1: Get owner/manager from JustFix
-            owner_info = await self._get_justfix_info(address)
-            if not owner_info:
-                return self._create_empty_result(address)
-                
-            # Step 2: Search for contact info
-            contact_info = await self._search_contact_info(owner_info)
-            
-            # Step 3: Scrape website for emails
-            if contact_info.get('website'):
-                email_info = await self._scrape_website_emails(contact_info['website'])
-                contact_info.update(email_info)
+            # Pace lookups so JustFix and Google don't start throttling or captcha-ing us
+            await contact_limiter.acquire()
+            async with self.page_pool() as page:
+                contact_info = await _bounded(
+                    self._lookup_contacts(page, address), FIND_CONTACTS_TIMEOUT, "Contact lookup for %s" % address
+                )
+            if contact_info is None:
+                empty_result = self._create_empty_result(address)
+                _CONTACT_CACHE.set(cache_key, empty_result, EMPTY_CONTACT_CACHE_TTL)
+                return empty_result
             
             # Cache results
-            self.cache[address] = contact_info
-            logger.info(f"ContactFinder.find_contacts returning: {contact_info}")
+            _CONTACT_CACHE.set(cache_key, contact_info, CONTACT_CACHE_TTL)
+            logger.debug("ContactFinder.find_contacts returning: %s", contact_info)
             return contact_info
             
         except Exception as e:
-            logger.error(f"Error finding contacts for {address}: {str(e)}")
+            logger.error("Error finding contacts for %s: %s", address, e)
             return self._create_empty_result(address)
             
-    async def _get_justfix_info(self, address: str) -> Optional[Dict]:
+    async def _lookup_contacts(self, page: Page, address: str) -> Optional[Dict]:
+        """Run the lookup steps for an address on a borrowed page; None if no owner was found."""
+        # Step 1: Get owner/manager from JustFix, through its API when possible
+        async def get_owner_info():
+            return await self._get_justfix_info_api(address) or await self._get_justfix_info(page, address)
+        
+        owner_info = await _bounded(get_owner_info(), OWNER_LOOKUP_TIMEOUT, "JustFix lookup")
+        if not owner_info:
+            return None
+            
+        # Step 2: Search for contact info
+        contact_info = await _bounded(
+            self._search_contact_info(page, owner_info), WEBSITE_SEARCH_TIMEOUT, "Website search"
+        ) or {'manager_name': owner_info.get('manager') or owner_info.get('owner')}
+        
+        # Step 3: Scrape website for emails
+        if contact_info.get('manager_website'):
+            email_info = await _bounded(
+                self._scrape_website_emails(page, contact_info['manager_website']),
+                WEBSITE_SCRAPE_TIMEOUT, "Website scrape"
+            )
+            if email_info:
+                contact_info.update(email_info)
+        
+        return contact_info
+    
+    async def find_contacts_many(self, addresses: List[str], max_concurrency: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Find contacts for several addresses concurrently.
+        
+        Args:
+            addresses: Building addresses to look up
+            max_concurrency: Maximum simultaneous lookups (defaults to the page pool size)
+            
+        Returns:
+            Dict mapping each address to its contact info; addresses whose
+            lookup raised are left out
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.pool_size)
+        unique_addresses = list(dict.fromkeys(addresses))
+        
+        async def find(address):
+            async with semaphore:
+                return await self.find_contacts(address)
+        
+        results = await asyncio.gather(
+            *(find(address) for address in unique_addresses),
+            return_exceptions=True
+        )
+        contacts = {}
+        for address, result in zip(unique_addresses, results):
+            if isinstance(result, Exception):
+                logger.error("Error finding contacts for %s: %s", address, result)
+                continue
+            contacts[address] = result
+        return contacts
+            
+    async def _get_justfix_info_api(self, address: str) -> Optional[Dict]:
+        """
+        Get property owner/manager info from the Who Owns What API.
+        
+        The address is geocoded to a BBL with NYC GeoSearch, then the BBL's HPD
+        registration contacts are read from the API. Returns None when either
+        step fails so the caller can fall back to the JustFix site.
+        """
+        try:
+            session = self._http_session()
+            async with session.get(GEOSEARCH_URL, params={'text': address, 'size': 1}) as response:
+                if response.status != 200:
+                    return None
+                geo = await response.json(content_type=None)
+            features = geo.get('features') or []
+            if not features:
+                return None
+            bbl = features[0].get('properties', {}).get('addendum', {}).get('pad', {}).get('bbl')
+            if not bbl:
+                return None
+            
+            async with session.get(JUSTFIX_API_URL, params={'bbl': bbl}) as response:
+                if response.status != 200:
+                    return None
+                data = await response.json(content_type=None)
+            addrs = data.get('addrs') or []
+            if not addrs:
+                return None
+            
+            contacts = {}
+            for contact in addrs[0].get('ownernames') or []:
+                contacts.setdefault(contact.get('title'), contact.get('value'))
+            owner_info = {
+                'owner': next((contacts[t] for t in _OWNER_TITLES if contacts.get(t)), None),
+                'manager': next((contacts[t] for t in _MANAGER_TITLES if contacts.get(t)), None)
+            }
+            if not owner_info['owner'] and not owner_info['manager']:
+                return None
+            return owner_info
+            
+        except Exception as e:
+            logger.warning("JustFix API lookup failed for %s: %s", address, e)
+            return None
+            
+    async def _get_justfix_info(self, page: Page, address: str) -> Optional[Dict]:
         """Get property owner/manager info from JustFix."""
         try:
             # Navigate to JustFix
-            await self.page.goto('https://whoownswhat.justfix.org', wait_until='networkidle')
+            await page.goto('https://whoownswhat.justfix.org', wait_until='domcontentloaded', timeout=NAVIGATION_TIMEOUT)
             
             # Wait for search input and enter address
-            search_input = await self.page.wait_for_selector('input[type="search"], input[placeholder*="search"], input[placeholder*="address"]', timeout=10000)
+            search_input = await page.wait_for_selector('input[type="search"], input[placeholder*="search"], input[placeholder*="address"]', timeout=10000)
             if not search_input:
                 logger.error("Could not find search input on JustFix page")
                 return None
@@ -106,31 +547,13 @@ class ContactFinder:
             
             # Wait for results with multiple possible selectors
             try:
-                await self.page.wait_for_selector('.property-info, .search-results, .result-item', timeout=10000)
+                await page.wait_for_selector('.property-info, .search-results, .result-item', timeout=10000)
             except Exception as e:
-                logger.error(f"Timeout waiting for JustFix results: {str(e)}")
+                logger.error("Timeout waiting for JustFix results: %s", e)
                 return None
             
             # Extract owner/manager info with multiple possible selectors
-            owner_info = await self.page.evaluate('''() => {
-                const selectors = {
-                    owner: ['.owner-name', '.owner', '.property-owner', '[data-testid="owner-name"]'],
-                    manager: ['.manager-name', '.manager', '.property-manager', '[data-testid="manager-name"]']
-                };
-                
-                const getText = (selectors) => {
-                    for (const selector of selectors) {
-                        const element = document.querySelector(selector);
-                        if (element) return element.textContent.trim();
-                    }
-                    return null;
-                };
-                
-                return {
-                    owner: getText(selectors.owner),
-                    manager: getText(selectors.manager)
-                };
-            }''')
+            owner_info = await page.evaluate('window.__extractOwnerInfo()')
             
             if not owner_info.get('owner') and not owner_info.get('manager'):
                 logger.warning("No owner or manager information found on JustFix page")
@@ -139,21 +562,35 @@ class ContactFinder:
             return owner_info
             
         except Exception as e:
-            logger.error(f"Error getting JustFix info: {str(e)}")
+            logger.error("Error getting JustFix info: %s", e)
             return None
             
-    async def _search_contact_info(self, owner_info: Dict) -> Dict:
-        """Search for contact information using Google."""
+    async def _search_contact_info(self, page: Page, owner_info: Dict) -> Dict:
+        """
+        Search for the owner/manager's website: a guessed company domain first,
+        then DuckDuckGo's HTML results, and only then Google in the browser.
+        """
         try:
+            company = owner_info["owner"] or owner_info["manager"]
+            search_term = f'"{company} property management NYC email"'
+            website_url = (
+                await self._guess_company_website(company)
+                or await self._search_duckduckgo(search_term)
+            )
+            if website_url:
+                return {
+                    'manager_name': owner_info.get('manager') or owner_info.get('owner'),
+                    'manager_website': website_url
+                }
+            
             # Search for owner/manager
-            search_term = f'"{owner_info["owner"] or owner_info["manager"]} property management NYC email"'
-            await self.page.goto('https://www.google.com')
-            await self.page.fill('input[name="q"]', search_term)
-            await self.page.press('input[name="q"]', 'Enter')
+            await page.goto('https://www.google.com', wait_until='domcontentloaded', timeout=NAVIGATION_TIMEOUT)
+            await page.fill('input[name="q"]', search_term)
+            await page.press('input[name="q"]', 'Enter')
             
             # Wait for results and find relevant link
-            await self.page.wait_for_selector('div.g')
-            website_url = await self._find_relevant_website()
+            await page.wait_for_selector('div.g', timeout=10000)
+            website_url = await self._find_relevant_website(page)
             
             return {
                 'manager_name': owner_info.get('manager') or owner_info.get('owner'),
@@ -161,78 +598,137 @@ class ContactFinder:
             }
             
         except Exception as e:
-            logger.error(f"Error searching contact info: {str(e)}")
+            logger.error("Error searching contact info: %s", e)
             return {'manager_name': owner_info.get('manager') or owner_info.get('owner')}
             
-    async def _find_relevant_website(self) -> Optional[str]:
+    async def _find_relevant_website(self, page: Page) -> Optional[str]:
         """Find a relevant website from Google search results."""
         try:
             # Get all search results
-            results = await self.page.evaluate('''() => {
-                const results = [];
-                document.querySelectorAll('div.g').forEach(div => {
-                    const link = div.querySelector('a');
-                    if (link) {
-                        results.push({
-                            url: link.href,
-                            title: link.textContent,
-                            snippet: div.querySelector('.VwiC3b')?.textContent
-                        });
-                    }
-                });
-                return results;
-            }''')
-            
-            # Filter and rank results
-            for result in results:
-                url = result['url']
-                domain = urlparse(url).netloc.lower()
+            results = await page.evaluate('window.__extractSearchResults()')
+            return self._pick_website(results)
+            
+        except Exception as e:
+            logger.error("Error finding relevant website: %s", e)
+            return None
+    
+    def _pick_website(self, results: List[Dict]) -> Optional[str]:
+        """Pick the most relevant website from search results ({url, domain, title, snippet} dicts)."""
+        # Score results in one pass and keep the best (earliest on ties);
+        # spam/aggregator domains are never picked
+        best_url = None
+        best_score = -1
+        for result in results:
+            url = result['url']
+            domain = result.get('domain') or urlparse(url).netloc.lower()
+            if _is_spam_domain(domain):
+                continue
+            
+            score = 0
+            # Domain matching the company name is the strongest signal
+            if self._is_relevant_domain(domain, result['title']):
+                score += 10
+            snippet = (result.get('snippet') or '').lower()
+            if any(k in snippet for k in _MANAGEMENT_KEYWORDS):
+                score += 3
+            
+            if score > best_score:
+                best_url, best_score = url, score
                 
-                # Skip common spam/aggregator domains
-                if any(x in domain for x in ['yelp.com', 'facebook.com', 'linkedin.com', 'yellowpages.com']):
-                    continue
-                    
-                # Check if domain matches company name
-                if self._is_relevant_domain(domain, result['title']):
-                    return url
-                    
-            # If no perfect match, return first non-spam result
-            for result in results:
-                url = result['url']
-                domain = urlparse(url).netloc.lower()
-                if not any(x in domain for x in ['yelp.com', 'facebook.com', 'linkedin.com', 'yellowpages.com']):
-                    return url
-                    
+        return best_url
+    
+    async def _guess_company_website(self, company: Optional[str]) -> Optional[str]:
+        """Probe {company}.com and {company}nyc.com, returning the first that answers."""
+        if not company:
             return None
-            
+        slug = _NON_ALNUM_RE.sub('', _COMPANY_SUFFIX_RE.sub('', company.lower()))
+        if len(slug) < 4:
+            return None
+        
+        session = self._http_session()
+        for url in (f"https://{slug}.com", f"https://{slug}nyc.com"):
+            try:
+                async with session.head(
+                    url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=DOMAIN_GUESS_TIMEOUT)
+                ) as response:
+                    if response.status < 400:
+                        return str(response.url)
+            except Exception as e:
+                logger.debug("Guessed domain %s did not answer: %s", url, e)
+        return None
+    
+    async def _search_duckduckgo(self, search_term: str) -> Optional[str]:
+        """Find a relevant website from DuckDuckGo's static HTML results, or None."""
+        try:
+            async with self._http_session().get(DUCKDUCKGO_HTML_URL, params={'q': search_term}) as response:
+                if response.status != 200:
+                    return None
+                html = await response.text(errors='ignore')
         except Exception as e:
-            logger.error(f"Error finding relevant website: {str(e)}")
+            logger.debug("DuckDuckGo search failed: %s", e)
             return None
-            
-    async def _scrape_website_emails(self, website_url: str) -> Dict:
+        
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(None, self._parse_duckduckgo_results, html)
+        return self._pick_website(results)
+    
+    def _parse_duckduckgo_results(self, html: str) -> List[Dict]:
+        """Extract {url, domain, title, snippet} results from a DuckDuckGo HTML results page."""
+        results = []
+        for result in BeautifulSoup(html, _HTML_PARSER).select('.result'):
+            link = result.select_one('a.result__a')
+            if link is None or not link.get('href'):
+                continue
+            url = urljoin('https://duckduckgo.com', link['href'])
+            # Result links go through a redirect carrying the target in uddg
+            target = dict(parse_qsl(urlsplit(url).query)).get('uddg')
+            snippet = result.select_one('.result__snippet')
+            results.append({
+                'url': target or url,
+                'domain': urlsplit(target or url).netloc.lower(),
+                'title': link.get_text(),
+                'snippet': snippet.get_text() if snippet else None
+            })
+        return results
+            
+    async def _scrape_website_emails(self, page: Page, website_url: str) -> Dict:
         """Scrape emails and contact form from website."""
         try:
-            # Visit website
-            await self.page.goto(website_url)
+            # Visit website, with the browser only if a plain GET doesn't return
+            # server-rendered HTML
+            soup = await self._fetch_static(website_url)
+            if soup is not None:
+                contact_links = self._find_static_links(soup, website_url, _CONTACT_PAGE_KEYWORDS)
+            else:
+                await page.goto(website_url, wait_until='domcontentloaded', timeout=NAVIGATION_TIMEOUT)
+                contact_links = await self._find_contact_pages(page)
+            contact_pages = _unique_pages(contact_links)
+            
+            # Find and visit contact/leasing pages, several at a time in extra
+            # pages of the same context
+            semaphore = asyncio.Semaphore(CONTACT_PAGE_CONCURRENCY)
+            results = await asyncio.gather(
+                *(self._scrape_contact_page(page.context, page_url, semaphore) for page_url in contact_pages),
+                return_exceptions=True
+            )
             
-            # Find and visit contact/leasing pages
-            contact_pages = await self._find_contact_pages()
             emails = set()
             contact_form = None
-            
-            for page_url in contact_pages:
-                await self.page.goto(page_url)
-                
-                # Extract emails
-                page_emails = await self._extract_emails()
+            for page_url, result in zip(contact_pages, results):
+                if isinstance(result, Exception):
+                    logger.warning("Error scraping contact page %s: %s", page_url, result)
+                    continue
+                page_emails, page_form = result
                 emails.update(page_emails)
-                
-                # Look for contact form
                 if not contact_form:
-                    contact_form = await self._find_contact_form()
+                    contact_form = page_form
             
             # Prioritize emails
-            prioritized_email = self._prioritize_emails(emails, website_url)
+            # Site domain without "www." so it matches email domains
+            domain = urlparse(website_url).netloc.lower()
+            if domain.startswith('www.'):
+                domain = domain[4:]
+            prioritized_email = self._prioritize_emails(emails, domain)
             
             return {
                 'contact_email': prioritized_email,
@@ -240,95 +736,142 @@ class ContactFinder:
             }
             
         except Exception as e:
-            logger.error(f"Error scraping website: {str(e)}")
+            logger.error("Error scraping website: %s", e)
             return {}
             
-    async def _find_contact_pages(self) -> List[str]:
-        """Find contact/leasing/about pages on the website."""
-        try:
-            # Look for common contact page links
-            contact_links = await self.page.evaluate('''() => {
-                const links = [];
-                const keywords = ['contact', 'leasing', 'about', 'rent'];
-                document.querySelectorAll('a').forEach(a => {
-                    const text = a.textContent.toLowerCase();
-                    const href = a.href;
-                    if (keywords.some(k => text.includes(k)) && href) {
-                        links.push(href);
-                    }
-                });
-                return links;
-            }''')
-            
-            return list(set(contact_links))  # Remove duplicates
+    async def _scrape_contact_page(self, context, page_url: str, semaphore: asyncio.Semaphore) -> Tuple[set, Optional[str]]:
+        """Load a contact page (statically if possible, else in a new page of the context) and return its emails and contact form."""
+        async with semaphore:
+            soup = await self._fetch_static(page_url)
+            if soup is not None:
+                emails = self._find_static_emails(soup)
+                forms = self._find_static_links(soup, page_url, _CONTACT_FORM_KEYWORDS)
+                return emails, forms[0] if forms else None
             
+            page = await context.new_page()
+            try:
+                await page.goto(page_url, wait_until='domcontentloaded', timeout=NAVIGATION_TIMEOUT)
+                return await self._extract_page_contacts(page)
+            finally:
+                await page.close()
+            
+    def _http_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session for static fetches, opening it on first use."""
+        if self._session is None or self._session.closed:
+            # aiodns resolves without a thread per lookup, and resolved hosts are
+            # cached so repeat visits to a management company's domain skip DNS
+            connector = aiohttp.TCPConnector(
+                resolver=AsyncResolver(),
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                limit=64,
+                limit_per_host=8,
+                keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=STATIC_FETCH_TIMEOUT),
+                headers={'User-Agent': 'Mozilla/5.0 (compatible; ai_realtor)'}
+            )
+        return self._session
+    
+    async def _fetch_static(self, url: str) -> Optional[BeautifulSoup]:
+        """
+        Fetch a page with a plain HTTP GET and parse it.
+        
+        Returns None when the page needs a browser: a failed request, a non-HTML
+        response, or a JavaScript shell with almost no server-rendered text.
+        """
+        try:
+            async with self._http_session().get(url) as response:
+                if response.status != 200 or 'html' not in response.headers.get('Content-Type', ''):
+                    return None
+                html = await response.text(errors='ignore')
         except Exception as e:
-            logger.error(f"Error finding contact pages: {str(e)}")
-            return []
-            
-    async def _extract_emails(self) -> set:
-        """Extract email addresses from the current page."""
+            logger.debug("Static fetch of %s failed: %s", url, e)
+            return None
+        
+        # Parsing is CPU-bound; keep it off the event loop so other lookups proceed
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._parse_static_html, html)
+    
+    def _parse_static_html(self, html: str) -> Optional[BeautifulSoup]:
+        """Parse fetched HTML, or return None if it is a JavaScript shell without server-rendered text."""
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        body = soup.body
+        if body is None:
+            return None
+        for element in body(['script', 'style', 'noscript', 'template']):
+            element.extract()
+        if len(body.get_text(' ', strip=True)) < STATIC_MIN_TEXT_LENGTH:
+            return None
+        return soup
+    
+    def _find_static_emails(self, soup: BeautifulSoup) -> set:
+        """Find lowercased emails in parsed HTML's visible text and mailto: links."""
+        mailtos = [
+            unquote(a['href'][7:].split('?')[0])
+            for a in soup.find_all('a', href=True)
+            if a['href'].lower().startswith('mailto:')
+        ]
+        text = soup.get_text(' ') + ' ' + ' '.join(mailtos)
+        return {email.lower() for email in _EMAIL_RE.findall(text)}
+    
+    def _find_static_links(self, soup: BeautifulSoup, base_url: str, keywords: Tuple[str, ...]) -> List[str]:
+        """Find absolute URLs of links in parsed HTML whose text contains any of the keywords."""
+        links = []
+        for a in soup.find_all('a', href=True):
+            text = a.get_text().lower()
+            if any(k in text for k in keywords):
+                href = urljoin(base_url, a['href'])
+                if href not in links:
+                    links.append(href)
+        return links
+        
+    async def _find_contact_pages(self, page: Page) -> List[str]:
+        """Find contact/leasing/about pages on the website."""
         try:
-            # Get page content
-            content = await self.page.content()
-            
-            # Find all email addresses
-            email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-            emails = set(re.findall(email_pattern, content))
+            # Look for common contact page links
+            contact_links = await page.evaluate('window.__extractContactLinks()')
             
-            return emails
+            return contact_links  # Deduplicated by canonical URL by the caller
             
         except Exception as e:
-            logger.error(f"Error extracting emails: {str(e)}")
-            return set()
+            logger.error("Error finding contact pages: %s", e)
+            return []
             
-    async def _find_contact_form(self) -> Optional[str]:
-        """Find contact form URL on the current page."""
+    async def _extract_page_contacts(self, page: Page) -> Tuple[set, Optional[str]]:
+        """Extract email addresses and the contact form URL from the current page in one evaluate."""
         try:
-            # Look for common contact form patterns
-            form_url = await self.page.evaluate('''() => {
-                const keywords = ['contact', 'message', 'inquiry'];
-                for (const a of document.querySelectorAll('a')) {
-                    const text = a.textContent.toLowerCase();
-                    const href = a.href;
-                    if (keywords.some(k => text.includes(k)) && href) {
-                        return href;
-                    }
-                }
-                return null;
-            }''')
+            contacts = await page.evaluate('window.__extractPageContacts()')
             
-            return form_url
+            # Emails are lowercased once here for prioritization
+            return {email.lower() for email in contacts['emails']}, contacts['contactForm']
             
         except Exception as e:
-            logger.error(f"Error finding contact form: {str(e)}")
-            return None
+            logger.error("Error extracting page contacts: %s", e)
+            return set(), None
             
-    def _prioritize_emails(self, emails: set, website_url: str) -> Optional[str]:
-        """Prioritize email addresses based on relevance."""
+    def _prioritize_emails(self, emails: set, domain: str) -> Optional[str]:
+        """Prioritize email addresses based on relevance to the company's (lowercased) domain."""
         if not emails:
             return None
             
-        # Get website domain
-        domain = urlparse(website_url).netloc.lower()
-        
-        # First priority: leasing emails with company domain
+        # One pass, keeping the first email of each tier: leasing emails with the
+        # company domain, then any company-domain email, then leasing emails,
+        # then any email
+        company_email = leasing_email = None
         for email in emails:
-            if any(x in email.lower() for x in ['leasing', 'rentals']) and domain in email.lower():
+            is_company = domain in email
+            is_leasing = any(x in email for x in _LEASING_KEYWORDS)
+            if is_company and is_leasing:
                 return email
-                
-        # Second priority: any email with company domain
-        for email in emails:
-            if domain in email.lower():
-                return email
-                
-        # Third priority: leasing emails
-        for email in emails:
-            if any(x in email.lower() for x in ['leasing', 'rentals']):
-                return email
-                
-        # Last resort: any email
-        return next(iter(emails))
+            if is_company and company_email is None:
+                company_email = email
+            elif is_leasing and leasing_email is None:
+                leasing_email = email
+        
+        return company_email or leasing_email or next(iter(emails))
         
     def _is_relevant_domain(self, domain: str, title: str) -> bool:
         """Check if a domain is relevant to the company."""
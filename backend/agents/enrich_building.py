@@ -3,38 +3,156 @@ Agent for enriching building data with additional metadata.
 """
 
 import asyncio
+import hashlib
 import random
-from typing import Dict, Any, Optional
-import requests
-from langchain_openai import OpenAI
+import re
+from typing import Dict, Any, List, Optional, Union
+import orjson
+try:
+    import json_repair
+except ImportError:  # Malformed responses are then treated as parse errors
+    json_repair = None
+from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
+from geopy.adapters import AioHTTPAdapter
 from geopy.geocoders import Nominatim
 import os
 import logging
 import json
+from .utils.retry import llm_retry, LLM_REQUEST_TIMEOUT
+from .utils.rate_limiter import openai_limiter, nominatim_limiter, estimate_tokens
+from .utils.address import canonical_address
+from .utils.ttl_cache import TTLCache
+from db.geocode_cache import load_cached_geocode
+from db.models import GeocodeCache
 
 logger = logging.getLogger(__name__)
 
+# NYC boroughs as they appear in Nominatim address components, matched in one scan
+_BOROUGH_RE = re.compile(r'manhattan|brooklyn|queens|bronx|staten island', re.IGNORECASE)
+_ZIP_RE = re.compile(r'\d{5}')
+
+# Residential keywords looked for in (lowercased) building types
+_RESIDENTIAL_RE = re.compile(r'apartment|residential')
+
+# Markdown code fence the model sometimes wraps its JSON in
+_CODE_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+# Parsed AI analyses keyed by model and prompt hash. Repeat prompts skip the
+# OpenAI rate limiter and the LangChain response cache lookup entirely.
+ANALYSIS_CACHE_SIZE = 10_000
+ANALYSIS_CACHE_TTL = 24 * 3600  # seconds
+_ANALYSIS_CACHE = TTLCache(maxsize=ANALYSIS_CACHE_SIZE)
+
+# Default number of buildings enrich_buildings works on at once
+ENRICH_BATCH_CONCURRENCY = 8
+
+# In-process geocodes in front of the geocode_cache table, keyed by canonical_address()
+GEOCODE_CACHE_SIZE = 10_000
+GEOCODE_CACHE_TTL = 24 * 3600  # seconds
+_GEOCODE_CACHE = TTLCache(maxsize=GEOCODE_CACHE_SIZE)
+
+_ANALYSIS_SYSTEM_MESSAGE = "You are a real estate analysis expert. Analyze the building data and provide structured insights."
+
+# Parsed once at import instead of on every analysis
+_ANALYSIS_PROMPT = PromptTemplate.from_template("""
+                Analyze the following building data and provide insights:
+                
+                Building Data: {building_data}
+                
+                Please analyze and respond with:
+                1. Building type classification (residential_apartment, commercial, mixed_use, etc.)
+                2. Estimated property manager type (large company, small local, individual)
+                3. Investment attractiveness (high, medium, low)
+                4. Any notable features or concerns
+                
+                Format your response as JSON with keys: building_type, manager_type, investment_rating, notes
+                """)
+
+
+def _parse_llm_json(text: str) -> Any:
+    """Parse JSON from an LLM response, tolerating code fences and, with json_repair, minor syntax errors."""
+    raw = _CODE_FENCE_RE.sub('', text.strip())
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        if json_repair is None:
+            raise
+        repaired = json_repair.loads(raw)
+        if not isinstance(repaired, dict) or not repaired:
+            raise
+        return repaired
+
+
+def _prompt_key(llm, messages) -> tuple:
+    """Key an LLM call by model name and a hash of its messages."""
+    digest = hashlib.blake2b(json.dumps(messages, sort_keys=True).encode(), digest_size=16).hexdigest()
+    return getattr(llm, 'model_name', None), digest
+
 class BuildingEnricher:
     """
     Agent responsible for enriching building data with additional metadata.
     Uses AI and web search to gather comprehensive building information.
     """
     
-    def __init__(self, llm=None):
-        """Initialize the BuildingEnricher with optional LLM."""
+    def __init__(self, llm=None, llm_fast=None):
+        """
+        Initialize the BuildingEnricher with optional LLMs.
+        
+        llm_fast, if given, is a cheaper model tried first for the AI analysis.
+        """
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.serpapi_key = os.getenv("SERPAPI_API_KEY")
-        self.geolocator = Nominatim(user_agent="ai_realtor")
         
         # Initialize LangChain LLM if provided or API key is available
         self.llm = llm
         if not self.llm and self.openai_api_key:
-            self.llm = OpenAI(
+            self.llm = ChatOpenAI(
                 api_key=self.openai_api_key,
                 temperature=0.1,
-                model_name="gpt-4-turbo-preview"
+                model_name="gpt-4-turbo-preview",
+                timeout=LLM_REQUEST_TIMEOUT,
+                max_retries=0
             )
+        self.llm_fast = llm_fast
+        
+        # aiohttp-backed geocoder, opened on first use on the loop running enrichment
+        self._geolocator: Optional[Nominatim] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # New geocodes wait here until a pipeline transaction writes them to the
+        # geocode_cache table (see flush_geocode_cache)
+        self._pending_geocodes: Dict[str, Dict[str, Any]] = {}
+    
+    async def _geocoder(self) -> Nominatim:
+        """Return the async Nominatim geocoder, creating and entering it on first use."""
+        if self._geolocator is None:
+            # The adapter keeps one aiohttp session, opened when the geocoder's
+            # async context is entered, so geocodes reuse its connections
+            geolocator = Nominatim(user_agent="ai_realtor", adapter_factory=AioHTTPAdapter)
+            await geolocator.__aenter__()
+            if self._geolocator is not None:
+                # Another geocode opened one while this one was being entered
+                await geolocator.__aexit__(None, None, None)
+            else:
+                self._geolocator = geolocator
+                self._loop = asyncio.get_running_loop()
+        return self._geolocator
+    
+    async def close(self):
+        """Exit the geocoder's async context, closing its connections, if it was opened."""
+        geolocator, loop = self._geolocator, self._loop
+        self._geolocator = self._loop = None
+        if geolocator is None:
+            return
+        
+        # The geocoder belongs to the loop that opened it, which may be the
+        # pipeline's background loop rather than the caller's
+        closing = geolocator.__aexit__(None, None, None)
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(closing, loop))
+        else:
+            await closing
     
     async def enrich_building(self, building_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -46,79 +164,164 @@ class BuildingEnricher:
         Returns:
             Enriched building data dictionary
         """
-        logger.info(f"Enriching building data for: {building_data.get('address')}")
+        logger.debug("Enriching building data for: %s", building_data.get('address'))
         
         enriched_data = building_data.copy()
         
-        # Step 1: Validate and standardize address
-        enriched_data = await self._standardize_address(enriched_data)
-        logger.info(f"Standardized address: {enriched_data.get('standardized_address')}, confidence: {enriched_data.get('address_confidence')}")
-        
-        # Step 2: Get additional property details via web search
-        web_data = await self._search_building_online(enriched_data)
-        logger.info(f"Web search data: {web_data}")
+        # Steps 1 and 2: Validate and standardize address, and get additional
+        # property details via web search. The search only needs the raw
+        # address, so both run at once.
+        enriched_data, web_data = await asyncio.gather(
+            self._standardize_address(enriched_data),
+            self._search_building_online(enriched_data)
+        )
+        logger.debug("Standardized address: %s, confidence: %s", enriched_data.get('standardized_address'), enriched_data.get('address_confidence'))
+        logger.debug("Web search data: %s", web_data)
         enriched_data.update(web_data)
         
         # Step 3: Use AI to analyze and classify building
         if self.llm:
             ai_analysis = await self._ai_analyze_building(enriched_data)
-            logger.info(f"AI analysis: {ai_analysis}")
+            logger.debug("AI analysis: %s", ai_analysis)
             enriched_data.update(ai_analysis)
         
         # Step 4: Confirm it's a residential apartment building
         enriched_data['is_residential_confirmed'] = self._confirm_residential(enriched_data)
-        logger.info(f"Final enriched data: {enriched_data}")
+        logger.debug("Final enriched data: %s", enriched_data)
         
         return enriched_data
     
+    async def enrich_buildings(
+        self, buildings: List[Dict[str, Any]], max_concurrency: int = ENRICH_BATCH_CONCURRENCY
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Enrich several buildings concurrently.
+        
+        Geocoding stays within Nominatim's one request per second however
+        many enrichments are running.
+        
+        Args:
+            buildings: Basic building information for each building
+            max_concurrency: Maximum simultaneous enrichments
+            
+        Returns:
+            Enriched data for each building, in order; buildings whose
+            enrichment raised get the exception instead
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def enrich(building):
+            async with semaphore:
+                return await self.enrich_building(building)
+        
+        return await asyncio.gather(
+            *(enrich(building) for building in buildings),
+            return_exceptions=True
+        )
+    
     async def _standardize_address(self, building_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Standardize and validate the building address.
         """
         address = building_data.get('address', '')
+        key = canonical_address(address)
         
         try:
-            # Use geocoding to standardize address
-            location = self.geolocator.geocode(address, exactly_one=True)
+            geocoded = await self._load_geocode(key) if key else None
+            if geocoded is None:
+                await nominatim_limiter.acquire()
+                geocoded = await self._geocode(address)
+                if geocoded and key:
+                    self._store_geocode(key, geocoded)
             
-            if location:
-                # Extract components from the standardized address
-                address_parts = location.address.split(',')
-                
-                # Clean and standardize the address parts
-                cleaned_parts = [part.strip() for part in address_parts]
-                
-                # Reconstruct the address in a standard format
-                # For NYC addresses, we want: Street Address, Borough, NY ZIP
-                if len(cleaned_parts) >= 3:
-                    street = cleaned_parts[0]
-                    city_or_borough = next((part for part in cleaned_parts if any(borough in part.lower() for borough in ['manhattan', 'brooklyn', 'queens', 'bronx', 'staten island'])), 'New York')
-                    state = next((part for part in cleaned_parts if 'NY' in part or 'New York' in part), 'NY')
-                    zip_code = next((part for part in cleaned_parts if part.strip().isdigit() and len(part.strip()) == 5), '')
-                    
-                    # Construct standardized address
-                    standardized_address = f"{street}, {city_or_borough}, {state}"
-                    if zip_code:
-                        standardized_address += f" {zip_code}"
-                    
-                    building_data['standardized_address'] = standardized_address
-                    building_data['latitude'] = location.latitude
-                    building_data['longitude'] = location.longitude
-                    building_data['address_confidence'] = 'high'
-                else:
-                    building_data['standardized_address'] = location.address
-                    building_data['latitude'] = location.latitude
-                    building_data['longitude'] = location.longitude
-                    building_data['address_confidence'] = 'medium'
+            if geocoded:
+                building_data.update(geocoded)
             else:
                 building_data['address_confidence'] = 'low'
                 
         except Exception as e:
-            print(f"Error standardizing address: {e}")
+            logger.error("Error standardizing address: %s", e)
             building_data['address_confidence'] = 'error'
         
         return building_data
     
+    async def _load_geocode(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a previous geocode in memory, then in the geocode_cache table."""
+        geocoded = _GEOCODE_CACHE.get(key)
+        if geocoded is not None:
+            return geocoded
+        try:
+            geocoded = await asyncio.get_running_loop().run_in_executor(None, load_cached_geocode, key)
+        except Exception as e:
+            logger.error("Error loading cached geocode: %s", e)
+            return None
+        if geocoded is not None:
+            _GEOCODE_CACHE.set(key, geocoded, GEOCODE_CACHE_TTL)
+        return geocoded
+    
+    def _store_geocode(self, key: str, geocoded: Dict[str, Any]):
+        """Remember a geocode in memory and queue it for the geocode_cache table."""
+        _GEOCODE_CACHE.set(key, geocoded, GEOCODE_CACHE_TTL)
+        self._pending_geocodes[key] = geocoded
+    
+    def flush_geocode_cache(self, db):
+        """
+        Write geocodes found since the last flush to the geocode_cache table.
+        
+        They are added to the caller's session rather than committed on their
+        own, so a run holding SQLite's write lock never waits on itself.
+        """
+        while self._pending_geocodes:
+            key, payload = self._pending_geocodes.popitem()
+            db.merge(GeocodeCache(address_key=key, payload=payload))
+    
+    async def _geocode(self, address: str) -> Optional[Dict[str, Any]]:
+        """
+        Geocode an address with Nominatim into standardized address fields, or None if not found.
+        """
+        # Use geocoding to standardize address
+        geolocator = await self._geocoder()
+        location = await geolocator.geocode(address, exactly_one=True)
+        if not location:
+            return None
+        
+        # Extract components from the standardized address
+        address_parts = location.address.split(',')
+        
+        # Clean and standardize the address parts
+        cleaned_parts = [part.strip() for part in address_parts]
+        
+        # Reconstruct the address in a standard format
+        # For NYC addresses, we want: Street Address, Borough, NY ZIP
+        if len(cleaned_parts) >= 3:
+            street = cleaned_parts[0]
+            city_or_borough = state = zip_code = None
+            for part in cleaned_parts:
+                if city_or_borough is None and _BOROUGH_RE.search(part):
+                    city_or_borough = part
+                if state is None and ('NY' in part or 'New York' in part):
+                    state = part
+                if zip_code is None and _ZIP_RE.fullmatch(part):
+                    zip_code = part
+            city_or_borough = city_or_borough or 'New York'
+            state = state or 'NY'
+            
+            # Construct standardized address
+            standardized_address = f"{street}, {city_or_borough}, {state}"
+            if zip_code:
+                standardized_address += f" {zip_code}"
+            confidence = 'high'
+        else:
+            standardized_address = location.address
+            confidence = 'medium'
+        
+        return {
+            'standardized_address': standardized_address,
+            'latitude': location.latitude,
+            'longitude': location.longitude,
+            'address_confidence': confidence
+        }
+    
     async def _search_building_online(self, building_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Search for building information online using web search APIs.
@@ -135,7 +338,7 @@ class BuildingEnricher:
                 web_data = await self._mock_web_search(address)
                 
         except Exception as e:
-            print(f"Error searching building online: {e}")
+            logger.error("Error searching building online: %s", e)
             web_data = await self._mock_web_search(address)
         
         return web_data
@@ -144,26 +347,9 @@ class BuildingEnricher:
         """
         Search for building information using SerpAPI.
         """
-        try:
-            # Search for building information
-            search_query = f"{address} apartment building property manager contact"
-            
-            params = {
-                "q": search_query,
-                "location": "New York, NY",
-                "api_key": self.serpapi_key,
-                "num": 10
-            }
-            
-            # response = requests.get("https://serpapi.com/search", params=params)
-            # results = response.json()
-            
-            # For now, return mock data
-            return await self._mock_web_search(address)
-            
-        except Exception as e:
-            print(f"Error with SerpAPI search: {e}")
-            return await self._mock_web_search(address)
+        # Search stays mocked until _extract_building_features can turn SerpAPI
+        # results into building fields; until then a live request would be wasted
+        return await self._mock_web_search(address)
     
     async def _mock_web_search(self, address: str) -> Dict[str, Any]:
         """
@@ -190,44 +376,57 @@ class BuildingEnricher:
         return mock_data
     
     async def _ai_analyze_building(self, building_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Use AI to analyze building data and extract insights."""
+        """
+        Use AI to analyze building data and extract insights.
+        
+        The fast model answers first when one is configured; the analysis is
+        only re-run on the main model if the fast answer can't be used.
+        """
+        prompt = _ANALYSIS_PROMPT.format(building_data=building_data)
+        
+        logger.debug("OpenAI prompt: %s", prompt)
+        
+        messages = [
+            {"role": "system", "content": _ANALYSIS_SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt}
+        ]
+        
+        if self.llm_fast:
+            analysis = await self._analyze_with(self.llm_fast, messages)
+            if analysis["ai_confidence"] != "error" and analysis["ai_building_type"] != "unknown":
+                return analysis
+            logger.info("Fast model analysis inconclusive, retrying with main model")
+        
+        return await self._analyze_with(self.llm, messages)
+    
+    async def _analyze_with(self, llm, messages) -> Dict[str, Any]:
+        """Run the analysis prompt on an LLM and parse its JSON response."""
+        cache_key = _prompt_key(llm, messages)
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("AI analysis cache hit")
+            return dict(cached)
+        
         try:
-            prompt = f"""
-                Analyze the following building data and provide insights:
-                
-                Building Data: {building_data}
-                
-                Please analyze and respond with:
-                1. Building type classification (residential_apartment, commercial, mixed_use, etc.)
-                2. Estimated property manager type (large company, small local, individual)
-                3. Investment attractiveness (high, medium, low)
-                4. Any notable features or concerns
-                
-                Format your response as JSON with keys: building_type, manager_type, investment_rating, notes
-                """
-            
-            logger.info(f"OpenAI prompt: {prompt}")
-            
             # Use chat completions endpoint
-            response = await self.llm.ainvoke([
-                {"role": "system", "content": "You are a real estate analysis expert. Analyze the building data and provide structured insights."},
-                {"role": "user", "content": prompt}
-            ])
+            response = await self._invoke_llm(llm, messages)
             
             try:
                 # Parse the JSON response
-                insights = json.loads(response.content)
-                logger.info(f"AI analysis response: {insights}")
+                insights = _parse_llm_json(response.content)
+                logger.debug("AI analysis response: %s", insights)
                 
-                return {
+                analysis = {
                     "ai_building_type": insights.get("building_type", "unknown"),
                     "ai_manager_type": insights.get("manager_type", "unknown"),
                     "ai_investment_rating": insights.get("investment_rating", "unknown"),
                     "ai_notes": insights.get("notes", ""),
                     "ai_confidence": "high"  # We trust the model's analysis
                 }
+                _ANALYSIS_CACHE.set(cache_key, analysis, ANALYSIS_CACHE_TTL)
+                return dict(analysis)
             except json.JSONDecodeError as e:
-                logger.error(f"Error parsing AI response: {str(e)}")
+                logger.error("Error parsing AI response: %s", e)
                 return {
                     "ai_building_type": "unknown",
                     "ai_manager_type": "unknown",
@@ -237,7 +436,7 @@ class BuildingEnricher:
                 }
                 
         except Exception as e:
-            logger.error(f"Error in AI analysis: {str(e)}")
+            logger.error("Error in AI analysis: %s", e)
             return {
                 "ai_building_type": "unknown",
                 "ai_manager_type": "unknown",
@@ -246,26 +445,31 @@ class BuildingEnricher:
                 "ai_confidence": "error"
             }
     
+    @llm_retry
+    async def _invoke_llm(self, llm, messages):
+        """Invoke an LLM within the shared OpenAI rate limit, retrying transient failures with backoff."""
+        await openai_limiter.acquire(estimate_tokens(messages, completion_tokens=256))
+        return await llm.ainvoke(messages)
+    
     def _confirm_residential(self, building_data: Dict[str, Any]) -> bool:
         """
         Confirm that the building is a residential apartment building.
         """
         # Check multiple indicators
-        building_type = building_data.get('building_type', '').lower()
-        ai_type = building_data.get('ai_building_type', '').lower()
-        name = building_data.get('name', '').lower()
-        
-        residential_indicators = [
-            'apartment' in building_type,
-            'residential' in building_type,
-            'apartment' in ai_type,
-            'residential' in ai_type,
-            'apartment' in name,
-            building_data.get('number_of_units', 0) > 10  # Multi-unit building
-        ]
+        building_type = (building_data.get('building_type') or '').lower()
+        ai_type = (building_data.get('ai_building_type') or '').lower()
+        
+        # Count true indicators, stopping as soon as two are found
+        score = len(set(_RESIDENTIAL_RE.findall(building_type)))
+        if score < 2:
+            score += len(set(_RESIDENTIAL_RE.findall(ai_type)))
+        if score < 2:
+            score += 'apartment' in (building_data.get('name') or '').lower()
+        if score < 2:
+            score += (building_data.get('number_of_units') or 0) > 10  # Multi-unit building
         
         # Building is confirmed residential if at least 2 indicators are true
-        return sum(residential_indicators) >= 2
+        return score >= 2
     
     def _extract_building_features(self, web_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -3,12 +3,27 @@ Agent for finding residential apartment buildings within a bounding box using Op
 """
 
 import asyncio
-from typing import List, Dict, Any
+import hashlib
+from typing import List, Dict, Any, Optional, AsyncIterator
 import os
-from openai import OpenAI
+from openai import APITimeoutError, OpenAI
 import json
 import googlemaps
+import logging
 from datetime import datetime
+from .utils.retry import llm_retry, LLM_REQUEST_TIMEOUT, LLM_RETRY_DEADLINE
+from .utils.rate_limiter import openai_limiter, estimate_tokens
+from .utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# web_search tool results reused for repeated queries
+WEB_SEARCH_CACHE_SIZE = 1_000
+WEB_SEARCH_CACHE_TTL = 86400  # seconds
+
+# Overall budget for one _async_openai_call (seconds), covering rate limit
+# waits, every attempt and the backoff between retries
+OPENAI_CALL_DEADLINE = LLM_RETRY_DEADLINE + LLM_REQUEST_TIMEOUT
 
 
 class BuildingFinder:
@@ -17,30 +32,36 @@ class BuildingFinder:
     Uses both OpenAI and Google Places API to research actual buildings in the specified area.
     """
     
-    def __init__(self, google_api_key: str = None):
-        # Initialize OpenAI
+    def __init__(self, google_api_key: str = None, openai_client=None):
+        # Initialize OpenAI (reuse the caller's client and connection pool when provided)
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        if self.openai_api_key:
+        if openai_client:
+            self.openai_client = openai_client
+            logger.info("✅ Using shared OpenAI client for building research")
+        elif self.openai_api_key:
             from openai import AsyncOpenAI
-            self.openai_client = AsyncOpenAI(api_key=self.openai_api_key)
-            print("✅ OpenAI API key configured for building research")
+            self.openai_client = AsyncOpenAI(api_key=self.openai_api_key, max_retries=0)
+            logger.info("✅ OpenAI API key configured for building research")
         else:
             self.openai_client = None
-            print("⚠️ No OpenAI API key found")
+            logger.warning("⚠️ No OpenAI API key found")
             
         # Initialize Google Maps client
         self.gmaps_api_key = google_api_key or os.getenv("GOOGLE_MAPS_API_KEY")
         if self.gmaps_api_key:
             try:
                 self.gmaps = googlemaps.Client(key=self.gmaps_api_key)
-                print("✅ Google Maps API key configured")
+                logger.info("✅ Google Maps API key configured")
             except Exception as e:
-                print(f"⚠️ Error initializing Google Maps client: {e}")
+                logger.warning("⚠️ Error initializing Google Maps client: %s", e)
                 self.gmaps = None
-                print("⚠️ Skipping Google services initialization for testing")
+                logger.warning("⚠️ Skipping Google services initialization for testing")
         else:
             self.gmaps = None
-            print("⚠️ No Google Maps API key found")
+            logger.warning("⚠️ No Google Maps API key found")
+        
+        # web_search tool results keyed by query hash
+        self._web_search_cache = TTLCache(maxsize=WEB_SEARCH_CACHE_SIZE)
     
     async def get_buildings_from_bbox(self, bbox: Dict[str, float]) -> List[Dict[str, Any]]:
         """
@@ -55,7 +76,7 @@ class BuildingFinder:
         Raises:
             Exception: If neither API is configured or both fail
         """
-        print(f"Researching real buildings for bbox: {bbox}")
+        logger.info("Researching real buildings for bbox: %s", bbox)
         
         try:
             # First try Google Places API
@@ -68,11 +89,11 @@ class BuildingFinder:
                 enhanced_buildings = await self._enhance_buildings_with_openai(buildings, bbox)
                 return enhanced_buildings
             except Exception as e:
-                print(f"❌ OpenAI enhancement failed: {e}")
+                logger.error("❌ OpenAI enhancement failed: %s", e)
                 raise  # Re-raise the exception to be handled by the caller
                 
         except Exception as e:
-            print(f"❌ Error finding buildings: {e}")
+            logger.error("❌ Error finding buildings: %s", e)
             raise  # Re-raise the exception to be handled by the caller
     
     async def _get_buildings_with_google_places(self, bbox: Dict[str, float]) -> List[Dict[str, Any]]:
@@ -96,101 +117,153 @@ class BuildingFinder:
             dlng = lng2 - lng1
             radius = sqrt((R * dlat)**2 + (R * cos(lat1) * dlng)**2) / 2
             
-            # Search for residential buildings using multiple keywords and types
-            all_places = []
-            search_types = ['apartment_complex', 'lodging']
-            search_keywords = [
-                'residential apartment building',
-                'apartment rentals',
-                'luxury apartments',
-                'rental building'
-            ]
+            # googlemaps calls block; run them in the executor so lookups for
+            # several bounding boxes gathered together actually overlap
+            loop = asyncio.get_running_loop()
+            all_places = await loop.run_in_executor(
+                None, self._search_places, center_lat, center_lng, radius
+            )
+            logger.info("✅ Found %s potential buildings via Google Places API", len(all_places))
             
-            for search_type in search_types:
-                for keyword in search_keywords:
-                    try:
-                        places_result = self.gmaps.places_nearby(
-                            location=(center_lat, center_lng),
-                            radius=min(radius, 5000),  # Max 5km radius
-                            type=search_type,
-                            keyword=keyword
-                        )
-                        
-                        # Add unique places
-                        for place in places_result.get('results', []):
-                            if not any(p['place_id'] == place['place_id'] for p in all_places):
-                                all_places.append(place)
-                                
-                    except Exception as e:
-                        print(f"⚠️ Error in places_nearby search: {e}")
-                        continue
+            details = await asyncio.gather(
+                *(loop.run_in_executor(None, self._place_details, place) for place in all_places)
+            )
+            buildings = []
+            for place, place_details in zip(all_places, details):
+                building_data = self._place_to_building(place, place_details)
+                if building_data:
+                    buildings.append(building_data)
+            
+            logger.info("✅ Found %s verified residential buildings via Google Places API", len(buildings))
+            return buildings
             
-            print(f"✅ Found {len(all_places)} potential buildings via Google Places API")
+        except Exception as e:
+            logger.error("❌ Error in Google Places API call: %s", e)
+            return []  # Return empty list if API fails
+    
+    async def stream_buildings(self, location: Dict[str, float], search_radius: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield residential buildings around a location as their place details arrive.
+        
+        Args:
+            location: Dict with 'lat' and 'lng' for the search center
+            search_radius: Radius in meters to search
             
-            buildings = []
-            for place in all_places:
+        Yields:
+            Building data dictionaries
+        """
+        loop = asyncio.get_running_loop()
+        all_places = await loop.run_in_executor(
+            None, self._search_places, location['lat'], location['lng'], search_radius
+        )
+        logger.info("✅ Found %s potential buildings via Google Places API", len(all_places))
+        
+        for place in all_places:
+            # Details lookups are blocking googlemaps calls; run them off the event
+            # loop so buildings already yielded keep being processed meanwhile
+            details = await loop.run_in_executor(None, self._place_details, place)
+            building_data = self._place_to_building(place, details)
+            if building_data:
+                yield building_data
+    
+    def _search_places(self, center_lat: float, center_lng: float, radius: float) -> List[Dict[str, Any]]:
+        """Search Google Places for residential buildings around a point, returning unique places."""
+        # Search for residential buildings using multiple keywords and types
+        all_places = []
+        seen_place_ids = set()
+        search_types = ['apartment_complex', 'lodging']
+        search_keywords = [
+            'residential apartment building',
+            'apartment rentals',
+            'luxury apartments',
+            'rental building'
+        ]
+        
+        for search_type in search_types:
+            for keyword in search_keywords:
                 try:
-                    # Get detailed place information with correct fields
-                    details = self.gmaps.place(place['place_id'], fields=[
-                        'name',
-                        'formatted_address',
-                        'type',
-                        'formatted_phone_number',
-                        'website',
-                        'business_status',
-                        'geometry/location'
-                    ])['result']
-                    
-                    # Get the place type from the original search result
-                    place_types = place.get('types', [])
-                    
-                    # Initial filtering for residential buildings
-                    if not any(t in place_types for t in [
-                        'apartment',
-                        'apartment_complex',
-                        'lodging',
-                        'real_estate_agency',
-                        'residential'
-                    ]):
-                        continue
-                    
-                    # Skip obvious non-residential places
-                    skip_types = [
-                        'hotel', 'hostel', 'motel', 'resort',
-                        'restaurant', 'store', 'shop', 'retail'
-                    ]
-                    if any(t in place_types for t in skip_types):
-                        continue
-                    
-                    # Create building data
-                    building_data = {
-                        "name": details.get('name'),
-                        "address": details.get('formatted_address'),
-                        "phone": details.get('formatted_phone_number'),  # Changed from contact_phone to phone
-                        "website": details.get('website'),
-                        "place_types": place_types,
-                        "latitude": details['geometry']['location']['lat'],
-                        "longitude": details['geometry']['location']['lng']
-                    }
-                    buildings.append(building_data)
+                    places_result = self.gmaps.places_nearby(
+                        location=(center_lat, center_lng),
+                        radius=min(radius, 5000),  # Max 5km radius
+                        type=search_type,
+                        keyword=keyword
+                    )
                     
+                    # Add unique places
+                    for place in places_result.get('results', []):
+                        if place['place_id'] not in seen_place_ids:
+                            seen_place_ids.add(place['place_id'])
+                            all_places.append(place)
+                            
                 except Exception as e:
-                    print(f"⚠️ Error getting place details: {e}")
+                    logger.warning("⚠️ Error in places_nearby search: %s", e)
                     continue
+        
+        return all_places
+    
+    def _place_details(self, place: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get detailed place information, or None if the lookup fails."""
+        try:
+            return self.gmaps.place(place['place_id'], fields=[
+                'name',
+                'formatted_address',
+                'type',
+                'formatted_phone_number',
+                'website',
+                'business_status',
+                'geometry/location'
+            ])['result']
+        except Exception as e:
+            logger.warning("⚠️ Error getting place details: %s", e)
+            return None
+    
+    def _place_to_building(self, place: Dict[str, Any], details: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Build building data from a place and its details, or None if it isn't residential."""
+        if not details:
+            return None
+        
+        try:
+            # Get the place type from the original search result
+            place_types = place.get('types', [])
             
-            print(f"✅ Found {len(buildings)} verified residential buildings via Google Places API")
-            return buildings
+            # Initial filtering for residential buildings
+            if not any(t in place_types for t in [
+                'apartment',
+                'apartment_complex',
+                'lodging',
+                'real_estate_agency',
+                'residential'
+            ]):
+                return None
             
+            # Skip obvious non-residential places
+            skip_types = [
+                'hotel', 'hostel', 'motel', 'resort',
+                'restaurant', 'store', 'shop', 'retail'
+            ]
+            if any(t in place_types for t in skip_types):
+                return None
+            
+            # Create building data
+            return {
+                "name": details.get('name'),
+                "address": details.get('formatted_address'),
+                "phone": details.get('formatted_phone_number'),  # Changed from contact_phone to phone
+                "website": details.get('website'),
+                "place_types": place_types,
+                "latitude": details['geometry']['location']['lat'],
+                "longitude": details['geometry']['location']['lng']
+            }
         except Exception as e:
-            print(f"❌ Error in Google Places API call: {e}")
-            return []  # Return empty list if API fails
+            logger.warning("⚠️ Error getting place details: %s", e)
+            return None
     
     async def _get_buildings_with_openai(self, bbox: Dict[str, float]) -> List[Dict[str, Any]]:
         """
         Use OpenAI to research buildings in the given bounding box.
         """
         try:
-            print(f"🔍 Researching buildings in bbox: {bbox}")
+            logger.info("🔍 Researching buildings in bbox: %s", bbox)
             
             prompt = f"""Given these NYC coordinates:
             North: {bbox['north']}
@@ -221,7 +294,7 @@ class BuildingFinder:
 
             IMPORTANT: Return ONLY valid JSON with real buildings. No explanations. Return exactly 5 buildings."""
 
-            print("⏳ Calling OpenAI API...")
+            logger.debug("⏳ Calling OpenAI API...")
             
             response = self.openai_client.chat.completions.create(
                 model="gpt-3.5-turbo",
@@ -234,7 +307,7 @@ class BuildingFinder:
             )
             
             ai_response = response.choices[0].message.content.strip()
-            print(f"📋 Raw OpenAI response: {ai_response}")
+            logger.debug("📋 Raw OpenAI response: %s", ai_response)
             
             try:
                 buildings_data = json.loads(ai_response)
@@ -246,16 +319,16 @@ class BuildingFinder:
                         # If we got a single building object, wrap it in a list
                         buildings_data = [buildings_data]
                         
-                print(f"✅ Successfully parsed JSON response with {len(buildings_data)} buildings")
+                logger.info("✅ Successfully parsed JSON response with %s buildings", len(buildings_data))
                 return buildings_data
                 
             except json.JSONDecodeError as e:
-                print(f"❌ Failed to parse JSON: {e}")
-                print(f"Full response: {ai_response}")
+                logger.error("❌ Failed to parse JSON: %s", e)
+                logger.debug("Full response: %s", ai_response)
                 raise Exception("Failed to parse building data from OpenAI response")
             
         except Exception as e:
-            print(f"❌ Error in OpenAI API call: {e}")
+            logger.error("❌ Error in OpenAI API call: %s", e)
             raise e
     
     def _get_nyc_neighborhood(self, lat: float, lon: float) -> str:
@@ -306,14 +379,14 @@ class BuildingFinder:
         Process buildings in batches to avoid timeouts.
         """
         try:
-            print(f"🔍 Verifying and enhancing {len(buildings)} buildings with OpenAI")
+            logger.info("🔍 Verifying and enhancing %s buildings with OpenAI", len(buildings))
             enhanced_buildings = []
             batch_size = 3  # Process 3 buildings at a time
             
             # Process buildings in batches
             for i in range(0, len(buildings), batch_size):
                 batch = buildings[i:i + batch_size]
-                print(f"📦 Processing batch {i//batch_size + 1} of {(len(buildings) + batch_size - 1)//batch_size}")
+                logger.debug("📦 Processing batch %s of %s", i//batch_size + 1, (len(buildings) + batch_size - 1)//batch_size)
                 
                 # Prepare buildings data for OpenAI
                 buildings_str = json.dumps([{
@@ -350,10 +423,9 @@ Return a JSON array with the enhanced building information. Each building should
                         {"role": "user", "content": prompt}
                     ]
 
-                    # Initial API call with timeout
+                    # Initial API call
                     response = await asyncio.wait_for(
-                        self._async_openai_call(messages),
-                        timeout=30  # 30 second timeout
+                        self._async_openai_call(messages), timeout=OPENAI_CALL_DEADLINE
                     )
 
                     message = response.choices[0].message
@@ -366,13 +438,7 @@ Return a JSON array with the enhanced building information. Each building should
                                 # Execute web search
                                 args = json.loads(tool_call.function.arguments)
                                 search_query = args["query"]
-                                print(f"🔍 Searching web for: {search_query}")
-                                
-                                # Mock web search results for now
-                                search_results = f"Found information about {search_query}:\n"
-                                search_results += "- Type: Residential apartment building\n"
-                                search_results += "- Units: Multiple units available\n"
-                                search_results += "- Amenities: Modern building features"
+                                search_results = await self._web_search(search_query)
                                 
                                 # Add tool result back to conversation
                                 messages.append({
@@ -385,19 +451,19 @@ Return a JSON array with the enhanced building information. Each building should
                         # Make final API call with all context
                         final_response = await asyncio.wait_for(
                             self._async_openai_call(messages, response_format={"type": "json_object"}),
-                            timeout=30  # 30 second timeout
+                            timeout=OPENAI_CALL_DEADLINE
                         )
                         
                         # Get the final JSON response
                         final_content = final_response.choices[0].message.content
-                        print(f"📋 Raw OpenAI response length: {len(final_content)} characters")
-                        print(f"First 100 characters of response: {final_content[:100]}")
+                        logger.debug("📋 Raw OpenAI response length: %s characters", len(final_content))
+                        logger.debug("First 100 characters of response: %s", final_content[:100])
                         
                         try:
                             enhanced_data = json.loads(final_content)
                             if isinstance(enhanced_data, dict):
                                 if "error" in enhanced_data:
-                                    print(f"⚠️ Received string instead of dict: {enhanced_data['error']}")
+                                    logger.warning("⚠️ Received string instead of dict: %s", enhanced_data['error'])
                                     continue
                                 elif "buildings" in enhanced_data:
                                     enhanced_data = enhanced_data["buildings"]
@@ -410,14 +476,14 @@ Return a JSON array with the enhanced building information. Each building should
                             enhanced_buildings.extend(enhanced_data)
                             
                         except json.JSONDecodeError as e:
-                            print(f"❌ Failed to parse JSON response: {e}")
+                            logger.error("❌ Failed to parse JSON response: %s", e)
                             continue
                             
-                except asyncio.TimeoutError:
-                    print("❌ OpenAI API call timed out")
+                except (APITimeoutError, asyncio.TimeoutError):
+                    logger.error("❌ OpenAI API call timed out")
                     continue
                 except Exception as e:
-                    print(f"❌ Error processing batch: {e}")
+                    logger.error("❌ Error processing batch: %s", e)
                     continue
                 
                 # Add a small delay between batches
@@ -426,9 +492,29 @@ Return a JSON array with the enhanced building information. Each building should
             return enhanced_buildings
             
         except Exception as e:
-            print(f"❌ Error in OpenAI enhancement: {e}")
+            logger.error("❌ Error in OpenAI enhancement: %s", e)
             return []
 
+    async def _web_search(self, query: str) -> str:
+        """Run the web_search tool for a query, reusing cached results for repeated queries."""
+        key = hashlib.sha256(query.encode()).hexdigest()
+        cached = self._web_search_cache.get(key)
+        if cached is not None:
+            logger.debug("Using cached web search results for: %s", query)
+            return cached
+        
+        logger.debug("🔍 Searching web for: %s", query)
+        
+        # Mock web search results for now
+        search_results = f"Found information about {query}:\n"
+        search_results += "- Type: Residential apartment building\n"
+        search_results += "- Units: Multiple units available\n"
+        search_results += "- Amenities: Modern building features"
+        
+        self._web_search_cache.set(key, search_results, WEB_SEARCH_CACHE_TTL)
+        return search_results
+    
+    @llm_retry
     async def _async_openai_call(self, messages, response_format=None):
         """Helper method to make async OpenAI API calls"""
         kwargs = {
@@ -436,6 +522,7 @@ Return a JSON array with the enhanced building information. Each building should
             "messages": messages,
             "temperature": 0.1,
             "max_tokens": 2000,
+            "timeout": LLM_REQUEST_TIMEOUT,
             "tools": [{
                 "type": "function",
                 "function": {
@@ -457,5 +544,7 @@ Return a JSON array with the enhanced building information. Each building should
         
         if response_format:
             kwargs["response_format"] = response_format
-            
+        
+        # Wait for room in the shared OpenAI budget instead of running into 429s
+        await openai_limiter.acquire(estimate_tokens(messages, completion_tokens=kwargs["max_tokens"]))
         return await self.openai_client.chat.completions.create(**kwargs) 
\ No newline at end of file
@@ -0,0 +1,51 @@
+import re
+from typing import Optional
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_address(address: Optional[str]) -> str:
+    """Normalize an address for use as a cache or dedup key (lowercased, whitespace-collapsed)."""
+    if not address:
+        return ""
+    return _WHITESPACE_RE.sub(' ', address.strip().lower())
+
+
+# Unit designators and everything after them up to the next comma ("apt 2 rear", "#4b", "suite 300")
+_UNIT_RE = re.compile(r'\s*(?:\b(?:apt|apartment|unit|suite|ste|floor|rm|room)\b\.?|#)[^,]*')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Street suffixes and directionals reduced to their USPS abbreviations
+_ABBREVIATIONS = {
+    'street': 'st',
+    'avenue': 'ave',
+    'av': 'ave',
+    'road': 'rd',
+    'boulevard': 'blvd',
+    'place': 'pl',
+    'drive': 'dr',
+    'lane': 'ln',
+    'court': 'ct',
+    'terrace': 'ter',
+    'parkway': 'pkwy',
+    'square': 'sq',
+    'east': 'e',
+    'west': 'w',
+    'north': 'n',
+    'south': 's',
+}
+
+
+def canonical_address(address: Optional[str]) -> str:
+    """
+    Reduce an address to a canonical key for duplicate detection.
+    
+    Unit designators and punctuation are dropped and street suffixes/directionals
+    abbreviated, so "123 Main Street Apt 2" and "123 Main St." share a key.
+    """
+    normalized = normalize_address(address)
+    if not normalized:
+        return ""
+    normalized = _UNIT_RE.sub(' ', normalized)
+    normalized = _PUNCTUATION_RE.sub(' ', normalized)
+    return ' '.join(_ABBREVIATIONS.get(word, word) for word in normalized.split())
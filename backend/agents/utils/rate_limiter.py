@@ -0,0 +1,80 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for requests per minute and (optionally) tokens per minute.
+    
+    burst caps how many requests can go out back to back (by default a full
+    minute's worth); burst=1 spaces requests evenly. Callers wait for capacity
+    before issuing a request instead of backing off after a 429. State is
+    guarded by a thread lock rather than an asyncio.Lock so one limiter can be
+    shared by coroutines on different event loops.
+    """
+    
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None, burst: Optional[float] = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.burst = float(burst or requests_per_minute)
+        self._available_requests = self.burst
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """Replenish capacity for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self._available_requests = min(
+            self.burst,
+            self._available_requests + elapsed * self.requests_per_minute / 60
+        )
+        if self.tokens_per_minute:
+            self._available_tokens = min(
+                self.tokens_per_minute,
+                self._available_tokens + elapsed * self.tokens_per_minute / 60
+            )
+    
+    async def acquire(self, tokens: int = 0):
+        """Wait until one request (and the estimated tokens) fit in the budget, then consume them."""
+        if self.tokens_per_minute:
+            # A request larger than the whole budget would otherwise wait forever
+            tokens = min(tokens, self.tokens_per_minute)
+        
+        while True:
+            with self._lock:
+                self._refill()
+                enough_tokens = not self.tokens_per_minute or self._available_tokens >= tokens
+                if self._available_requests >= 1 and enough_tokens:
+                    self._available_requests -= 1
+                    if self.tokens_per_minute:
+                        self._available_tokens -= tokens
+                    return
+                
+                wait = max(0.0, (1 - self._available_requests) * 60 / self.requests_per_minute)
+                if not enough_tokens:
+                    wait = max(wait, (tokens - self._available_tokens) * 60 / self.tokens_per_minute)
+            await asyncio.sleep(wait)
+
+
+def estimate_tokens(messages, completion_tokens: int = 0) -> int:
+    """Rough token estimate for chat messages (about four characters per token)."""
+    return sum(len(str(message.get('content') or '')) for message in messages) // 4 + completion_tokens
+
+
+# Shared OpenAI budget for the account (override with OPENAI_RPM / OPENAI_TPM)
+openai_limiter = RateLimiter(
+    requests_per_minute=float(os.getenv("OPENAI_RPM", "500")),
+    tokens_per_minute=float(os.getenv("OPENAI_TPM", "150000"))
+)
+
+# Browser contact lookups hitting JustFix and Google (override with CONTACT_LOOKUPS_PER_MINUTE)
+contact_limiter = RateLimiter(requests_per_minute=float(os.getenv("CONTACT_LOOKUPS_PER_MINUTE", "30")))
+
+# Nominatim's usage policy allows at most one request per second, without bursts
+nominatim_limiter = RateLimiter(requests_per_minute=60, burst=1)
@@ -0,0 +1,36 @@
+import logging
+
+import openai
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential_jitter,
+)
+
+logger = logging.getLogger(__name__)
+
+# OpenAI errors worth retrying: rate limits, dropped connections/timeouts and 5xx responses
+RETRYABLE_LLM_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+# Timeout for a single OpenAI request attempt (seconds)
+LLM_REQUEST_TIMEOUT = 30
+
+# Give up retrying once this many seconds have passed since the first attempt
+LLM_RETRY_DEADLINE = 120
+
+# Retry decorator for coroutines that call the OpenAI API directly or through LangChain.
+# This is the only retry layer: OpenAI clients are created with max_retries=0
+llm_retry = retry(
+    retry=retry_if_exception_type(RETRYABLE_LLM_ERRORS),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5) | stop_after_delay(LLM_RETRY_DEADLINE),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
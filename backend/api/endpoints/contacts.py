@@ -2,16 +2,35 @@
 API endpoints for finding building contacts.
 """
 
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
-from agents.contact_finder.contact_finder import ContactFinder
+from agents.contact_finder.contact_finder import (
+    ContactFinder, cache_contacts, close_shared_browser, get_cached_contacts, invalidate_cached_contacts
+)
+from agents.utils.address import canonical_address
+from db.contact_cache import delete_cached_contacts, has_contact, load_cached_contacts, save_cached_contacts
 
 router = APIRouter()
 
+# Browser-backed ContactFinder shared by all requests, started on first use.
+# Concurrent lookups each borrow a page from its pool.
+_finder: Optional[ContactFinder] = None
+_finder_lock = asyncio.Lock()
+
+
+async def close_contact_finder():
+    """Close the shared ContactFinder and the server loop's browser, if they were started."""
+    global _finder
+    if _finder is not None:
+        await _finder.__aexit__(None, None, None)
+        _finder = None
+    await close_shared_browser()
+
 class ContactRequest(BaseModel):
     """Request model for finding contacts."""
     address: str
@@ -35,9 +54,47 @@ async def find_contacts(request: ContactRequest):
     Returns:
         ContactResponse containing the found contact information
     """
+    global _finder
+    try:
+        # The shared in-memory cache comes first, then lookups persisted by
+        # earlier requests or pipeline runs, and only then the network. Every
+        # layer is keyed by canonical_address().
+        loop = asyncio.get_running_loop()
+        key = canonical_address(request.address)
+        result = get_cached_contacts(request.address)
+        if result is None and key:
+            result = await loop.run_in_executor(None, load_cached_contacts, key)
+            if result is not None:
+                cache_contacts(request.address, result)
+        if result is None:
+            async with _finder_lock:
+                if _finder is None:
+                    _finder = await ContactFinder().__aenter__()
+            result = await _finder.find_contacts(request.address)
+            if key and has_contact(result):
+                await loop.run_in_executor(None, save_cached_contacts, key, result)
+        return ContactResponse(**result)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/cache")
+async def invalidate_contact_cache(address: str):
+    """
+    Forget cached contact information for an address so the next lookup runs again.
+    
+    Args:
+        address: The building address whose cached lookup should be dropped
+        
+    Returns:
+        Whether a cached lookup was found in memory or in the database
+    """
     try:
-        async with ContactFinder() as finder:
-            result = await finder.find_contacts(request.address)
-            return ContactResponse(**result)
+        # The in-memory cache is shared with the pipeline, so this clears its entry too
+        key = canonical_address(address)
+        in_memory = invalidate_cached_contacts(address)
+        loop = asyncio.get_running_loop()
+        persisted = await loop.run_in_executor(None, delete_cached_contacts, key) if key else False
+        return {"address": address, "invalidated": in_memory or persisted}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,50 @@
+"""
+Persistent contact lookup cache backed by the contact_cache table.
+
+Entries are keyed by canonical_address() of the looked-up address, the same
+key as ContactFinder's in-memory cache, and are shared by the pipeline and
+the contacts API across processes and restarts.
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from .database import SessionLocal
+from .models import ContactCache
+
+# Cached lookups older than this are ignored and looked up again
+CONTACT_CACHE_MAX_AGE = timedelta(days=int(os.getenv("CONTACT_CACHE_MAX_AGE_DAYS", "30")))
+
+
+def has_contact(contact_info: Optional[Dict[str, Any]]) -> bool:
+    """Check if a contact lookup result found anyone to contact; only those are persisted."""
+    return bool(contact_info) and any(
+        contact_info.get(key) for key in ('email', 'contact_email', 'name', 'manager_name', 'contact_phone')
+    )
+
+
+def load_cached_contacts(address_norm: str) -> Optional[Dict[str, Any]]:
+    """Load a fresh cached contact lookup on its own short-lived session."""
+    with SessionLocal() as session:
+        entry = session.get(ContactCache, address_norm)
+        if entry is None:
+            return None
+        if entry.updated_at and entry.updated_at < datetime.utcnow() - CONTACT_CACHE_MAX_AGE:
+            return None
+        return entry.payload
+
+
+def save_cached_contacts(address_norm: str, payload: Dict[str, Any]):
+    """Store a contact lookup on its own short-lived session."""
+    with SessionLocal() as session:
+        session.merge(ContactCache(address_norm=address_norm, payload=payload))
+        session.commit()
+
+
+def delete_cached_contacts(address_norm: str) -> bool:
+    """Remove a cached contact lookup, returning whether one existed."""
+    with SessionLocal() as session:
+        deleted = session.query(ContactCache).filter(ContactCache.address_norm == address_norm).delete()
+        session.commit()
+        return bool(deleted)
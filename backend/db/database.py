@@ -3,6 +3,7 @@ Database configuration and session management.
 """
 
 import os
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -13,11 +14,37 @@ load_dotenv()
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ai_realtor.db")
 
+
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson."""
+    return orjson.dumps(value).decode()
+
+
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+engine_options = {
+    # JSON columns are encoded once, by the column type, using orjson
+    "json_serializer": _json_serializer,
+    "json_deserializer": orjson.loads,
+    "insertmanyvalues_page_size": 1000,
+    # Larger compiled-statement cache so the pipeline's bulk statements stay cached
+    "query_cache_size": 1200,
+    "connect_args": {"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+}
+if DATABASE_URL.startswith(("postgresql://", "postgresql+psycopg2://")):
+    # Send executemany batches as multi-row INSERT ... VALUES statements
+    engine_options["executemany_mode"] = "values_plus_batch"
+if "sqlite" not in DATABASE_URL:
+    # Pool sized for the pipeline's concurrent work; LIFO keeps hot connections
+    # in use, pre-ping and recycle drop connections the server has closed
+    engine_options.update(
+        pool_size=20,
+        max_overflow=30,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    )
+
+engine = create_engine(DATABASE_URL, **engine_options)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,29 @@
+"""
+Persistent geocoding cache backed by the geocode_cache table.
+
+Entries are keyed by canonical_address() of the geocoded address, so repeat
+lookups skip Nominatim across runs and restarts. New entries are written by
+BuildingEnricher.flush_geocode_cache() inside the pipeline's own transaction.
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from .database import SessionLocal
+from .models import GeocodeCache
+
+# Cached geocodes older than this are ignored and geocoded again
+GEOCODE_CACHE_MAX_AGE = timedelta(days=int(os.getenv("GEOCODE_CACHE_MAX_AGE_DAYS", "30")))
+
+
+def load_cached_geocode(address_key: str) -> Optional[Dict[str, Any]]:
+    """Load a fresh cached geocode on its own short-lived session."""
+    with SessionLocal() as session:
+        entry = session.get(GeocodeCache, address_key)
+        if entry is None:
+            return None
+        if entry.updated_at and entry.updated_at < datetime.utcnow() - GEOCODE_CACHE_MAX_AGE:
+            return None
+        return entry.payload
+
@@ -0,0 +1,53 @@
+"""
+Migration script to add canonical_address column to buildings table.
+"""
+
+from sqlalchemy.sql import text
+
+from agents.utils.address import canonical_address
+from .convert_coordinates_to_float import column_type
+
+
+def upgrade(engine):
+    """Add an indexed canonical_address column and backfill it from address."""
+    with engine.begin() as conn:
+        if engine.dialect.name == 'postgresql':
+            conn.execute(text("""
+                ALTER TABLE buildings
+                ADD COLUMN IF NOT EXISTS canonical_address VARCHAR;
+            """))
+        elif column_type(conn, 'buildings', 'canonical_address') is None:
+            conn.execute(text("""
+                ALTER TABLE buildings
+                ADD COLUMN canonical_address VARCHAR;
+            """))
+        
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_buildings_canonical_address
+            ON buildings (canonical_address);
+        """))
+        
+        # Backfill existing rows
+        rows = conn.execute(text("""
+            SELECT id, address
+            FROM buildings
+            WHERE canonical_address IS NULL;
+        """)).fetchall()
+        if rows:
+            conn.execute(
+                text("UPDATE buildings SET canonical_address = :canonical WHERE id = :id;"),
+                [{'id': row.id, 'canonical': canonical_address(row.address)} for row in rows]
+            )
+        print(f"✅ Added canonical_address column ({len(rows)} rows backfilled)")
+
+
+def downgrade(engine):
+    """Remove canonical_address column from buildings table."""
+    with engine.begin() as conn:
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_buildings_canonical_address;
+        """))
+        conn.execute(text("""
+            ALTER TABLE buildings
+            DROP COLUMN canonical_address;
+        """))
@@ -0,0 +1,45 @@
+"""
+Migration script to make buildings.canonical_address unique.
+"""
+
+from sqlalchemy.sql import text
+
+
+def upgrade(engine):
+    """Replace the canonical_address index with a unique one, clearing the key on later duplicates."""
+    with engine.begin() as conn:
+        # Keep the key on the oldest building of each duplicate group; the
+        # others keep their rows (and email logs) but drop out of the index
+        conn.execute(text("""
+            UPDATE buildings
+            SET canonical_address = NULL
+            WHERE canonical_address = ''
+               OR id NOT IN (
+                   SELECT MIN(id)
+                   FROM buildings
+                   WHERE canonical_address IS NOT NULL
+                   GROUP BY canonical_address
+               );
+        """))
+        
+        # Same name as the index declared on the model
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_buildings_canonical_address;
+        """))
+        conn.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_buildings_canonical_address
+            ON buildings (canonical_address);
+        """))
+        print("✅ Made canonical_address unique")
+
+
+def downgrade(engine):
+    """Go back to a non-unique index on canonical_address."""
+    with engine.begin() as conn:
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_buildings_canonical_address;
+        """))
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_buildings_canonical_address
+            ON buildings (canonical_address);
+        """))
@@ -0,0 +1,22 @@
+"""
+Migration script to index building names for duplicate detection.
+"""
+
+from sqlalchemy.sql import text
+
+def upgrade(engine):
+    """Create an index on buildings.name."""
+    with engine.begin() as conn:
+        # Same name as the index declared on the model, so create_all and this
+        # migration don't produce two indexes on the column
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_buildings_name
+            ON buildings (name);
+        """))
+
+def downgrade(engine):
+    """Drop the index on buildings.name."""
+    with engine.begin() as conn:
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_buildings_name;
+        """))
@@ -0,0 +1,66 @@
+"""
+Migration script to store latitude and longitude as numbers instead of text.
+"""
+
+from sqlalchemy.sql import text
+
+COORDINATE_COLUMNS = ('latitude', 'longitude')
+
+
+def column_type(conn, table_name, column_name):
+    """Return the declared SQLite type of a column, or None if it does not exist."""
+    return conn.execute(text(f"""
+        SELECT type
+        FROM pragma_table_info('{table_name}')
+        WHERE name='{column_name}';
+    """)).scalar()
+
+
+def upgrade(engine):
+    """Convert latitude and longitude columns to floating point."""
+    with engine.begin() as conn:
+        if engine.dialect.name == 'postgresql':
+            for column in COORDINATE_COLUMNS:
+                conn.execute(text(f"""
+                    ALTER TABLE buildings
+                    ALTER COLUMN {column} TYPE DOUBLE PRECISION
+                    USING NULLIF({column}, '')::double precision;
+                """))
+            print("✅ Converted coordinate columns to DOUBLE PRECISION")
+            return
+        
+        # SQLite can't change a column type in place, so copy each column
+        # through a REAL column with the same name
+        for column in COORDINATE_COLUMNS:
+            current_type = column_type(conn, 'buildings', column)
+            if current_type is None or current_type.upper() in ('REAL', 'FLOAT'):
+                print(f"ℹ️ {column} column already numeric or missing, skipping")
+                continue
+            
+            conn.execute(text(f"ALTER TABLE buildings ADD COLUMN {column}_numeric REAL;"))
+            conn.execute(text(f"""
+                UPDATE buildings
+                SET {column}_numeric = CAST(NULLIF({column}, '') AS REAL);
+            """))
+            conn.execute(text(f"ALTER TABLE buildings DROP COLUMN {column};"))
+            conn.execute(text(f"ALTER TABLE buildings RENAME COLUMN {column}_numeric TO {column};"))
+            print(f"✅ Converted {column} column to REAL")
+
+
+def downgrade(engine):
+    """Convert latitude and longitude columns back to text."""
+    with engine.begin() as conn:
+        if engine.dialect.name == 'postgresql':
+            for column in COORDINATE_COLUMNS:
+                conn.execute(text(f"""
+                    ALTER TABLE buildings
+                    ALTER COLUMN {column} TYPE VARCHAR
+                    USING {column}::varchar;
+                """))
+            return
+        
+        for column in COORDINATE_COLUMNS:
+            conn.execute(text(f"ALTER TABLE buildings ADD COLUMN {column}_text VARCHAR;"))
+            conn.execute(text(f"UPDATE buildings SET {column}_text = CAST({column} AS TEXT);"))
+            conn.execute(text(f"ALTER TABLE buildings DROP COLUMN {column};"))
+            conn.execute(text(f"ALTER TABLE buildings RENAME COLUMN {column}_text TO {column};"))
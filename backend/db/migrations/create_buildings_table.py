@@ -18,8 +18,8 @@ def upgrade(engine):
                 name VARCHAR,
                 address VARCHAR NOT NULL,
                 standardized_address VARCHAR,
-                latitude VARCHAR,
-                longitude VARCHAR,
+                latitude REAL,
+                longitude REAL,
                 building_type VARCHAR NOT NULL,
                 bounding_box JSON,
                 approved BOOLEAN DEFAULT FALSE,
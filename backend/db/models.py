@@ -19,8 +19,9 @@ class Building(Base):
     name = Column(String, index=True)
     address = Column(String, unique=True, index=True, nullable=False)
     standardized_address = Column(String, unique=True, index=True, nullable=True)
-    latitude = Column(String, nullable=True)
-    longitude = Column(String, nullable=True)
+    canonical_address = Column(String, unique=True, index=True, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
     building_type = Column(String, nullable=False)
     bounding_box = Column(JSON, nullable=True)
     approved = Column(Boolean, default=False)
@@ -116,4 +117,22 @@ class ContactSource(Base):
     extracted_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationship to building
-    building = relationship("Building") 
\ No newline at end of file
+    building = relationship("Building") 
+
+class ContactCache(Base):
+    """Model for caching contact lookups across pipeline runs."""
+    
+    __tablename__ = "contact_cache"
+    
+    address_norm = Column(String, primary_key=True)  # canonical_address() of the looked-up address
+    payload = Column(JSON, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class GeocodeCache(Base):
+    """Model for caching geocoded addresses across pipeline runs."""
+    
+    __tablename__ = "geocode_cache"
+    
+    address_key = Column(String, primary_key=True)  # canonical_address() of the geocoded address
+    payload = Column(JSON, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
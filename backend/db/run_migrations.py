@@ -9,6 +9,10 @@ from sqlalchemy import create_engine, text
 from .migrations.create_buildings_table import upgrade as create_buildings
 from .migrations.update_contact_info_to_json import upgrade as update_contact_info
 from .migrations.add_website import upgrade as add_website
+from .migrations.convert_coordinates_to_float import upgrade as convert_coordinates
+from .migrations.add_canonical_address import upgrade as add_canonical_address
+from .migrations.add_name_index import upgrade as add_name_index
+from .migrations.add_canonical_address_unique import upgrade as add_canonical_address_unique
 
 def check_database_exists(engine):
     """Check if the database file exists and has the buildings table."""
@@ -33,6 +37,10 @@ def run_migrations():
     create_buildings(engine)  # This now includes all necessary fields
     update_contact_info(engine)  # Update contact_info to JSON type
     add_website(engine)  # Add website column
+    convert_coordinates(engine)  # Store latitude/longitude as numbers
+    add_canonical_address(engine)  # Add canonical address dedup key
+    add_name_index(engine)  # Index name for duplicate detection
+    add_canonical_address_unique(engine)  # One building per canonical address
     
     print("✅ All migrations completed successfully")
 
@@ -12,6 +12,9 @@ import os
 import signal
 import sys
 import socket
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 from sqlalchemy import or_, and_
 import json
@@ -19,16 +22,37 @@ import json
 from db.database import get_database, init_database
 from db.models import Building, EmailLog
 from agents.building_pipeline import BuildingPipeline
-from agents.get_buildings import BuildingFinder
 # Commenting out Gmail service for now
 # from services.gmail_api import GmailService
-from api.endpoints.contacts import router as contacts_router
+from api.endpoints.contacts import router as contacts_router, close_contact_finder
 
 # Skip service imports that require Google auth for now
 print("⚠️ Skipping Google services initialization for testing")
 
 load_dotenv()
 
+
+def setup_logging() -> QueueListener:
+    """
+    Route all log records through a queue so handler I/O happens on a
+    listener thread instead of the event loop.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:] or [logging.StreamHandler()]
+    for handler in handlers:
+        root.removeHandler(handler)
+    
+    log_queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+log_listener = setup_logging()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Realtor API",
@@ -50,10 +74,16 @@ app.add_middleware(
 async def startup_event():
     init_database()
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await building_pipeline.aclose()
+    await close_contact_finder()
+    log_listener.stop()
+
 # Initialize services
 # gmail_service = GmailService()  # Commenting out for now
 building_pipeline = BuildingPipeline()
-building_finder = BuildingFinder()
+building_finder = building_pipeline.building_finder  # Reuse the pipeline's OpenAI/Maps clients
 
 # Pydantic models for request/response
 class BoundingBox(BaseModel):
@@ -73,8 +103,8 @@ class BuildingResponse(BaseModel):
     name: Optional[str] = None
     address: str
     standardized_address: Optional[str] = None
-    latitude: Optional[str] = None
-    longitude: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     building_type: str
     bounding_box: Optional[Dict[str, Any]] = None
     approved: bool
@@ -215,6 +245,13 @@ async def approve_building(
         raise HTTPException(status_code=500, detail=f"Error approving building: {str(e)}")
 
 
+def _json_field(value):
+    """Return a JSON column value, decoding rows stored as JSON-encoded strings."""
+    if isinstance(value, str):
+        return json.loads(value)
+    return value or None
+
+
 @app.get("/api/buildings")
 async def get_buildings(db: Session = Depends(get_database)):
     """
@@ -228,10 +265,10 @@ async def get_buildings(db: Session = Depends(get_database)):
         building_list = []
         for building in buildings:
             # Parse JSON fields
-            bounding_box = json.loads(building.bounding_box) if building.bounding_box else None
-            verification_flags = json.loads(building.verification_flags) if building.verification_flags else None
-            amenities = json.loads(building.amenities) if building.amenities else None
-            contact_info = json.loads(building.contact_info) if building.contact_info else None
+            bounding_box = _json_field(building.bounding_box)
+            verification_flags = _json_field(building.verification_flags)
+            amenities = _json_field(building.amenities)
+            contact_info = _json_field(building.contact_info)
             
             building_list.append({
                 "id": building.id,
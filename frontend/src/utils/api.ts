@@ -16,8 +16,8 @@ export interface Building {
   name?: string;
   address: string;
   standardized_address?: string;
-  latitude?: string;
-  longitude?: string;
+  latitude?: number;
+  longitude?: number;
   building_type: string;
   bounding_box?: Record<string, any>;
   approved: boolean;